@@ -35,7 +35,8 @@ def load_staging(con: duckdb.DuckDBPyConnection, root: Path) -> None:
     """
     Load raw CSV files from the project's raw-data directory into DuckDB staging tables.
 
-    Handles file naming discrepancies (underscore vs space).
+    Handles file naming discrepancies (underscore vs space) and refreshes
+    statistics on every table that was loaded.
 
     Args:
         con (duckdb.DuckDBPyConnection): The DuckDB connection.
@@ -47,6 +48,7 @@ def load_staging(con: duckdb.DuckDBPyConnection, root: Path) -> None:
 
     logger.info("Loading staging tables from %s...", raw_data_dir)
 
+    loaded_tables = []
     for table_name in schema.STAGING_TABLES:
         base_name = table_name.replace("staging_", "")
         file_path_underscore = raw_data_dir / (base_name + ".csv")
@@ -76,9 +78,15 @@ def load_staging(con: duckdb.DuckDBPyConnection, root: Path) -> None:
                 (FORMAT CSV, HEADER, DELIMITER ',', QUOTE '"', ESCAPE '"', AUTO_DETECT TRUE, NULL_PADDING TRUE, IGNORE_ERRORS TRUE)
                 """
             )
+            loaded_tables.append(table_name)
         except Exception:
             logger.exception("Failed to load %s", table_name)
 
+    # Refresh optimizer statistics so the transform joins are planned
+    # against the freshly loaded row counts.
+    for table_name in loaded_tables:
+        con.execute(f"ANALYZE {table_name}")
+
 
 def transform_dims(con: duckdb.DuckDBPyConnection) -> None:
     """
@@ -110,8 +118,9 @@ def transform_dims(con: duckdb.DuckDBPyConnection) -> None:
                     first_name,
                     last_name,
                     birthdate,
-                    lower(regexp_replace(last_name, '[^a-zA-Z0-9]', '', 'g')) as last_name_clean,
-                    lower(regexp_replace(first_name, '[^a-zA-Z0-9]', '', 'g')) as first_name_clean
+                    substring(lower(regexp_replace(last_name, '[^a-zA-Z0-9]', '', 'g')), 1, 5)
+                        || substring(lower(regexp_replace(first_name, '[^a-zA-Z0-9]', '', 'g')), 1, 2)
+                        AS slug_key
                 FROM staging_players
             ),
             player_slugs AS (
@@ -120,13 +129,10 @@ def transform_dims(con: duckdb.DuckDBPyConnection) -> None:
                     first_name,
                     last_name,
                     birthdate,
-                    substring(last_name_clean, 1, 5)
-                        || substring(first_name_clean, 1, 2)
+                    slug_key
                         || lpad(
                             row_number() OVER (
-                                PARTITION BY
-                                    substring(last_name_clean, 1, 5),
-                                    substring(first_name_clean, 1, 2)
+                                PARTITION BY slug_key
                                 ORDER BY person_id
                             )::text,
                             2,
@@ -188,21 +194,49 @@ def transform_v2_schema(con: duckdb.DuckDBPyConnection) -> None:
         GROUP BY abbreviation
     """)
 
-    logger.info("Transforming V2: team_seasons...")
+    # team_seasons and team_season_stats both need staging_team_summaries
+    # grouped by (season, abbreviation); aggregate it once and read from that.
     con.execute("""
-        INSERT INTO team_seasons (season_id, franchise_id, team_name, abbreviation, arena, arena_capacity)
+        CREATE OR REPLACE TEMP TABLE team_summary_rollup AS
         SELECT
-            CAST(season AS VARCHAR),
+            CAST(season AS VARCHAR) AS season_id,
             abbreviation,
-            MAX(team),
-            abbreviation,
-            MAX(arena),
-            MAX(TRY_CAST(attend AS INTEGER))
+            MAX(team) AS team_name,
+            MAX(arena) AS arena,
+            MAX(TRY_CAST(attend AS INTEGER)) AS arena_capacity,
+            MAX(TRY_CAST(w AS DOUBLE)) AS wins,
+            MAX(TRY_CAST(l AS DOUBLE)) AS losses,
+            MAX(TRY_CAST(mov AS DOUBLE)) AS mov,
+            MAX(TRY_CAST(sos AS DOUBLE)) AS sos,
+            MAX(TRY_CAST(srs AS DOUBLE)) AS srs,
+            MAX(TRY_CAST(o_rtg AS DOUBLE)) AS offensive_rating,
+            MAX(TRY_CAST(d_rtg AS DOUBLE)) AS defensive_rating,
+            MAX(TRY_CAST(n_rtg AS DOUBLE)) AS net_rating,
+            MAX(TRY_CAST(pace AS DOUBLE)) AS pace,
+            MAX(TRY_CAST(f_tr AS DOUBLE)) AS free_throw_rate,
+            MAX(TRY_CAST(x3p_ar AS DOUBLE)) AS three_point_attempt_rate,
+            MAX(TRY_CAST(ts_percent AS DOUBLE)) AS true_shooting_percentage,
+            MAX(TRY_CAST(e_fg_percent AS DOUBLE)) AS effective_fg_percentage,
+            MAX(TRY_CAST(tov_percent AS DOUBLE)) AS turnover_percentage,
+            MAX(TRY_CAST(orb_percent AS DOUBLE)) AS offensive_rebound_percentage
         FROM staging_team_summaries
         WHERE abbreviation IS NOT NULL
         GROUP BY season, abbreviation
     """)
 
+    logger.info("Transforming V2: team_seasons...")
+    con.execute("""
+        INSERT INTO team_seasons (season_id, franchise_id, team_name, abbreviation, arena, arena_capacity)
+        SELECT
+            season_id,
+            abbreviation,
+            team_name,
+            abbreviation,
+            arena,
+            arena_capacity
+        FROM team_summary_rollup
+    """)
+
     logger.info("Transforming V2: team_season_stats...")
     con.execute("""
         INSERT INTO team_season_stats (
@@ -212,29 +246,28 @@ def transform_v2_schema(con: duckdb.DuckDBPyConnection) -> None:
             effective_fg_percentage, turnover_percentage, offensive_rebound_percentage
         )
         SELECT
-            CAST(season AS VARCHAR),
+            season_id,
             abbreviation,
             NULL,
-            MAX(TRY_CAST(w AS INTEGER)),
-            MAX(TRY_CAST(l AS INTEGER)),
-            MAX(TRY_CAST(w AS DOUBLE)) / (MAX(TRY_CAST(w AS DOUBLE)) + MAX(TRY_CAST(l AS DOUBLE))),
-            MAX(TRY_CAST(mov AS DOUBLE)),
-            MAX(TRY_CAST(sos AS DOUBLE)),
-            MAX(TRY_CAST(srs AS DOUBLE)),
-            MAX(TRY_CAST(o_rtg AS DOUBLE)),
-            MAX(TRY_CAST(d_rtg AS DOUBLE)),
-            MAX(TRY_CAST(n_rtg AS DOUBLE)),
-            MAX(TRY_CAST(pace AS DOUBLE)),
-            MAX(TRY_CAST(f_tr AS DOUBLE)),
-            MAX(TRY_CAST(x3p_ar AS DOUBLE)),
-            MAX(TRY_CAST(ts_percent AS DOUBLE)),
-            MAX(TRY_CAST(e_fg_percent AS DOUBLE)),
-            MAX(TRY_CAST(tov_percent AS DOUBLE)),
-            MAX(TRY_CAST(orb_percent AS DOUBLE))
-        FROM staging_team_summaries
-        WHERE abbreviation IS NOT NULL
-        GROUP BY season, abbreviation
+            CAST(wins AS INTEGER),
+            CAST(losses AS INTEGER),
+            wins / NULLIF(wins + losses, 0),
+            mov,
+            sos,
+            srs,
+            offensive_rating,
+            defensive_rating,
+            net_rating,
+            pace,
+            free_throw_rate,
+            three_point_attempt_rate,
+            true_shooting_percentage,
+            effective_fg_percentage,
+            turnover_percentage,
+            offensive_rebound_percentage
+        FROM team_summary_rollup
     """)
+    con.execute("DROP TABLE team_summary_rollup")
 
     logger.info("Transforming V2: players...")
     con.execute("""
@@ -396,24 +429,39 @@ def transform_v2_schema(con: duckdb.DuckDBPyConnection) -> None:
     """)
 
     logger.info("Transforming V2: games...")
+    # Duplicate staging rows are dropped by the primary key via OR IGNORE,
+    # so no separate DISTINCT pass is needed here or in player_game_stats.
     con.execute("""
+        WITH team_abbreviations AS (
+            SELECT team_id, MAX(abbreviation) AS abbreviation
+            FROM staging_team_details
+            WHERE team_id IS NOT NULL
+            GROUP BY team_id
+        )
         INSERT OR IGNORE INTO games (game_id, season_id, game_date, home_franchise_id, away_franchise_id, home_score, away_score, attendance, arena_id)
-        SELECT DISTINCT
+        SELECT
             sg.game_id,
-            CASE
-                WHEN month(TRY_CAST(sg.game_date_time_est AS DATE)) >= 10 THEN CAST(year(TRY_CAST(sg.game_date_time_est AS DATE)) AS VARCHAR) || '-' || CAST(year(TRY_CAST(sg.game_date_time_est AS DATE)) + 1 AS VARCHAR)
-                ELSE CAST(year(TRY_CAST(sg.game_date_time_est AS DATE)) - 1 AS VARCHAR) || '-' || CAST(year(TRY_CAST(sg.game_date_time_est AS DATE)) AS VARCHAR)
-            END,
-            TRY_CAST(sg.game_date_time_est AS DATE),
+            CAST(sg.season_start AS VARCHAR) || '-' || CAST(sg.season_start + 1 AS VARCHAR),
+            sg.game_day,
             th.abbreviation,
             ta.abbreviation,
             TRY_CAST(sg.home_score AS INTEGER),
             TRY_CAST(sg.away_score AS INTEGER),
             TRY_CAST(sg.attendance AS INTEGER),
             sg.arena_id
-        FROM staging_games sg
-        LEFT JOIN staging_team_details th ON CAST(sg.hometeam_id AS VARCHAR) = CAST(th.team_id AS VARCHAR)
-        LEFT JOIN staging_team_details ta ON CAST(sg.awayteam_id AS VARCHAR) = CAST(ta.team_id AS VARCHAR)
+        FROM (
+            -- Seasons start in October: games before then belong to the
+            -- season that began the previous calendar year.
+            SELECT
+                *,
+                year(game_day) - CAST(month(game_day) < 10 AS INTEGER) AS season_start
+            FROM (
+                SELECT *, TRY_CAST(game_date_time_est AS DATE) AS game_day
+                FROM staging_games
+            )
+        ) sg
+        LEFT JOIN team_abbreviations th ON sg.hometeam_id = th.team_id
+        LEFT JOIN team_abbreviations ta ON sg.awayteam_id = ta.team_id
     """)
 
     logger.info("Transforming V2: player_game_stats...")
@@ -424,7 +472,7 @@ def transform_v2_schema(con: duckdb.DuckDBPyConnection) -> None:
             fgm, fga, fg3m, fg3a, ftm, fta,
             plus_minus
         )
-        SELECT DISTINCT
+        SELECT
             CAST(sps.person_id AS VARCHAR),
             sps.game_id,
             sps.playerteam_name, -- Assuming this is abbreviation (e.g. LAL)
@@ -536,6 +584,11 @@ def build() -> None:
         transform_dims(con)
         transform_v2_schema(con)
 
+        # Ship the database with statistics that reflect the loaded data so
+        # the API's first queries are not planned against empty-table stats.
+        logger.info("Analyzing tables...")
+        con.execute("ANALYZE")
+
         logger.info("Running validation...")
         validate_etl(con)
 
@@ -3,7 +3,9 @@
 from datetime import UTC, date, datetime
 
 import duckdb
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.db.connection import get_connection
 from app.schemas.game import BoxScoreResponse, Game, GameList, PlayByPlayData
@@ -143,6 +145,7 @@ def get_game_box_score(
 def get_game_play_by_play(
     game_id: int,
     period: int | None = None,
+    response_format: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
     conn: duckdb.DuckDBPyConnection = Depends(get_connection),
 ):
     """Get play-by-play data for a game.
@@ -150,6 +153,8 @@ def get_game_play_by_play(
     Args:
         game_id: The unique identifier of the game.
         period: Optional filter for a specific period/quarter.
+        response_format: ``json`` for a single document, or ``ndjson`` to
+            stream one play per line without buffering the whole game.
         conn: Database connection.
 
     Returns:
@@ -159,6 +164,15 @@ def get_game_play_by_play(
         HTTPException: If the game is not found.
     """
     service = GameService(conn)
+    if response_format == "ndjson":
+        plays = service.stream_play_by_play(game_id, period=period)
+        if plays is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+        return StreamingResponse(
+            (orjson.dumps(play, default=str) + b"\n" for play in plays),
+            media_type="application/x-ndjson",
+        )
+
     pbp = service.get_play_by_play(game_id, period=period)
     if pbp is None:
         raise HTTPException(status_code=404, detail="Game not found")
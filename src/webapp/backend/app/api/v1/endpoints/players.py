@@ -25,6 +25,8 @@ def list_players(  # noqa: PLR0913
     search: str | None = None,
     season: int | None = None,
     team: str | None = None,
+    *,
+    cursor: str | None = None,
     conn: duckdb.DuckDBPyConnection = Depends(get_connection),
 ):
     """List players with filtering options.
@@ -37,21 +39,29 @@ def list_players(  # noqa: PLR0913
         search: Search term for player name.
         season: Filter by season year.
         team: Filter by team abbreviation.
+        cursor: Keyset cursor from the previous page's ``next_cursor``.
         conn: Database connection.
 
     Returns:
         PlayerList: Paginated list of players.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
     """
     service = PlayerService(conn)
-    return service.list_players(
-        page=page,
-        per_page=per_page,
-        is_active=is_active,
-        position=position,
-        search=search,
-        season_year=season,
-        team_abbrev=team,
-    )
+    try:
+        return service.list_players(
+            page=page,
+            per_page=per_page,
+            is_active=is_active,
+            position=position,
+            search=search,
+            season_year=season,
+            team_abbrev=team,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/{player_slug}", response_model=PlayerDetail)
@@ -156,6 +166,7 @@ def get_player_career(
 def get_player_splits(
     player_slug: str,
     season_year: int,
+    season_type: str = Query("REGULAR", pattern="^(REGULAR|PLAYOFF)$"),
     conn: duckdb.DuckDBPyConnection = Depends(get_connection),
 ):
     """Get performance splits for a player in a specific season.
@@ -163,10 +174,11 @@ def get_player_splits(
     Args:
         player_slug: The unique slug of the player.
         season_year: The season year.
+        season_type: The type of season (REGULAR or PLAYOFF).
         conn: Database connection.
 
     Returns:
         dict: Player performance splits.
     """
     service = PlayerService(conn)
-    return service.get_player_splits(player_slug, season_year)
+    return service.get_player_splits(player_slug, season_year, season_type)
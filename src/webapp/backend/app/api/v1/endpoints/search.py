@@ -1,6 +1,7 @@
 """Search API endpoints."""
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_session
@@ -46,10 +47,15 @@ def autocomplete(
         session: Database session.
 
     Returns:
-        dict: Autocomplete suggestions.
+        Response: Autocomplete suggestions as JSON.
     """
     service = SearchService(session)
-    return service.autocomplete(query=q, limit=limit)
+    # Suggestions are flat dicts of strings and ints; hand them to orjson
+    # directly instead of walking them through jsonable_encoder first.
+    return Response(
+        content=orjson.dumps(service.autocomplete(query=q, limit=limit)),
+        media_type="application/json",
+    )
 
 
 @router.get("/players")
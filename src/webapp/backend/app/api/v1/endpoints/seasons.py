@@ -1,8 +1,9 @@
 """Seasons API endpoints."""
 
 import duckdb
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
+from app.core.cache import cached_response
 from app.db.connection import get_connection
 from app.schemas.season import Season, SeasonDetail, SeasonLeaders, SeasonSchedule
 from app.services.season_service import SeasonService
@@ -97,8 +98,10 @@ def get_season_schedule(
 
 
 @router.get("/{season_year}/leaders", response_model=SeasonLeaders)
-def get_season_leaders(
+def get_season_leaders(  # noqa: PLR0913
+    request: Request,
     season_year: int,
+    *,
     category: str = Query(
         "points", pattern="^(points|rebounds|assists|steals|blocks)$"
     ),
@@ -109,6 +112,7 @@ def get_season_leaders(
     """Get statistical leaders for a specific season.
 
     Args:
+        request: The incoming request.
         season_year: The year of the season.
         category: Statistical category (points, rebounds, assists, etc.).
         per_game: Whether to return per-game stats or totals.
@@ -119,11 +123,17 @@ def get_season_leaders(
         SeasonLeaders: List of leaders for the category.
     """
     service = SeasonService(conn)
-    return service.get_season_leaders(
-        season_year,
-        category=category,
-        per_game=per_game,
-        limit=limit,
+    return cached_response(
+        request,
+        f"leaders:{season_year}:{category}:{per_game}:{limit}",
+        lambda: service.get_season_leaders(
+            season_year,
+            category=category,
+            per_game=per_game,
+            limit=limit,
+        ),
+        model=SeasonLeaders,
+        season_year=season_year,
     )
 
 
@@ -1,8 +1,9 @@
 """Standings API endpoints."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
+from app.core.cache import cached_response
 from app.db.session import get_session
 from app.schemas.standings import PlayoffBracket, StandingsResponse
 from app.services.standings_service import StandingsService
@@ -12,6 +13,7 @@ router = APIRouter()
 
 @router.get("/{season_year}", response_model=StandingsResponse)
 def get_standings(
+    request: Request,
     season_year: int,
     view: str = Query("conference", pattern="^(conference|division|league)$"),
     date: str | None = None,
@@ -20,6 +22,7 @@ def get_standings(
     """Get standings for a specific season.
 
     Args:
+        request: The incoming request.
         season_year: The season year.
         view: The view mode (conference, division, or league).
         date: Optional date to get standings as of (YYYY-MM-DD).
@@ -31,7 +34,13 @@ def get_standings(
     service = StandingsService(session)
     if date:
         return service.get_standings_as_of_date(season_year, date, view=view)
-    return service.get_standings(season_year, view=view)
+    return cached_response(
+        request,
+        f"standings:{season_year}:{view}",
+        lambda: service.get_standings(season_year, view=view),
+        model=StandingsResponse,
+        season_year=season_year,
+    )
 
 
 @router.get("/{season_year}/by-date/{as_of_date}")
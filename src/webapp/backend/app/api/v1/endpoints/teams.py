@@ -1,8 +1,9 @@
 """Teams API endpoints."""
 
 import duckdb
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
+from app.core.cache import cached_response
 from app.db.connection import get_connection
 from app.schemas.team import RosterPlayer, ScheduleGame, Team, TeamSeasonStats
 from app.services.team_service import TeamService
@@ -82,6 +83,7 @@ def get_team_roster(
 
 @router.get("/{team_abbrev}/schedule/{season_year}", response_model=list[ScheduleGame])
 def get_team_schedule(
+    request: Request,
     team_abbrev: str,
     season_year: int,
     conn: duckdb.DuckDBPyConnection = Depends(get_connection),
@@ -89,6 +91,7 @@ def get_team_schedule(
     """Retrieve a team's schedule for a specific season.
 
     Args:
+        request: The incoming request.
         team_abbrev: Team abbreviation (e.g., 'LAL', 'BOS').
         season_year: The season year.
         conn: DuckDB database connection (injected by FastAPI).
@@ -97,7 +100,14 @@ def get_team_schedule(
         list[ScheduleGame]: List of scheduled games for the team.
     """
     service = TeamService(conn)
-    return service.get_team_schedule(team_abbrev.upper(), season_year)
+    team_abbrev = team_abbrev.upper()
+    return cached_response(
+        request,
+        f"schedule:{team_abbrev}:{season_year}",
+        lambda: service.get_team_schedule(team_abbrev, season_year),
+        model=list[ScheduleGame],
+        season_year=season_year,
+    )
 
 
 @router.get("/{team_abbrev}/stats/{season_year}", response_model=TeamSeasonStats)
@@ -1,8 +1,10 @@
 """Celery configuration for background task processing."""
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 
 from app.core.config import settings
+from app.db.connection import close_connection
 
 celery_app = Celery(
     "basketball_reference_api",
@@ -45,3 +47,13 @@ celery_app.conf.beat_schedule = {
         },
     },
 }
+
+
+@worker_process_shutdown.connect
+def _close_worker_connection(**_kwargs) -> None:
+    """Close the worker's shared DuckDB connection when the process exits.
+
+    Tasks reuse the singleton from app.db.connection for the life of the
+    worker process instead of opening one per task.
+    """
+    close_connection()
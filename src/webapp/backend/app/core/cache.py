@@ -0,0 +1,175 @@
+"""Redis-backed response cache with ETag support.
+
+Season-scoped responses (standings, leaders, schedules) only change when new
+games for that season are loaded. Cached bodies are keyed by the request
+parameters plus a version made of three parts:
+
+- the DuckDB file's modification time, which changes whenever an ETL build
+  swaps in a new database;
+- a global epoch counter, bumped by reindexes that span every season;
+- a per-season epoch counter, bumped when one season's games are reindexed.
+
+Changing any part invalidates the affected responses at once. After a Redis
+error the cache is bypassed for ``REDIS_RETRY_SECONDS`` so an unreachable
+server costs one socket timeout rather than one per request.
+"""
+
+import hashlib
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import redis
+import structlog
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.db.connection import database_version
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+REDIS_RETRY_SECONDS = 30.0
+
+_GLOBAL_EPOCH_KEY = "cache_epoch"
+
+_redis_retry_at = 0.0
+
+
+@lru_cache
+def get_redis_client() -> redis.Redis:
+    """Get the process-wide Redis client.
+
+    Returns:
+        redis.Redis: Client bound to ``settings.redis_url``.
+    """
+    return redis.Redis.from_url(
+        settings.redis_url,
+        socket_connect_timeout=0.25,
+        socket_timeout=0.25,
+    )
+
+
+@lru_cache
+def _get_adapter(model: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter for a response model."""
+    return TypeAdapter(model)
+
+
+def _epoch_key(season_year: int) -> str:
+    return f"season_epoch:{season_year}"
+
+
+def _redis_available() -> bool:
+    """Check whether the circuit breaker allows a Redis call."""
+    return time.monotonic() >= _redis_retry_at
+
+
+def _mark_redis_down() -> None:
+    """Open the circuit breaker after a Redis error."""
+    global _redis_retry_at  # noqa: PLW0603
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+    logger.warning("Redis unavailable, bypassing cache", seconds=REDIS_RETRY_SECONDS)
+
+
+def _cache_version(client: redis.Redis, season_year: int) -> str:
+    """Build the version part of a cache key in one Redis round trip.
+
+    Args:
+        client: The Redis client.
+        season_year: Season whose epoch scopes the cache entry.
+
+    Returns:
+        str: The database version plus the global and season epochs.
+    """
+    global_epoch, season_epoch = client.mget(
+        [_GLOBAL_EPOCH_KEY, _epoch_key(season_year)]
+    )
+    return f"{database_version()}:{int(global_epoch or 0)}:{int(season_epoch or 0)}"
+
+
+def bump_cache_epoch() -> None:
+    """Invalidate every cached response, across all seasons."""
+    try:
+        get_redis_client().incr(_GLOBAL_EPOCH_KEY)
+    except redis.RedisError:
+        logger.warning("Failed to bump cache epoch")
+
+
+def bump_season_epoch(season_year: int) -> None:
+    """Invalidate every cached response for a season.
+
+    Args:
+        season_year: The season year whose data changed.
+    """
+    try:
+        get_redis_client().incr(_epoch_key(season_year))
+    except redis.RedisError:
+        logger.warning("Failed to bump season cache epoch", season_year=season_year)
+
+
+def make_etag(body: bytes) -> str:
+    """Build a weak ETag for a response body.
+
+    Args:
+        body: The serialized response body.
+
+    Returns:
+        str: The ETag header value.
+    """
+    return f'W/"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+
+
+def cached_response(  # noqa: PLR0913
+    request: Request,
+    key: str,
+    build: Callable[[], Any],
+    *,
+    model: Any,
+    season_year: int,
+    ttl: int = DEFAULT_TTL_SECONDS,
+) -> Response:
+    """Serve a season-scoped JSON response from Redis.
+
+    On a miss the body is built, validated against ``model`` and stored for
+    ``ttl`` seconds. Redis errors fall back to building the body directly
+    and open the circuit breaker.
+    A matching ``If-None-Match`` header short-circuits with 304.
+
+    Args:
+        request: The incoming request.
+        key: Cache key identifying the request parameters.
+        build: Callable producing the uncached response data.
+        model: The endpoint's response model.
+        season_year: Season whose epoch scopes the cache entry.
+        ttl: Cache lifetime in seconds.
+
+    Returns:
+        Response: The JSON response, or an empty 304.
+    """
+    body = None
+    cache_key = None
+    if _redis_available():
+        try:
+            client = get_redis_client()
+            cache_key = f"response:{key}:{_cache_version(client, season_year)}"
+            body = client.get(cache_key)
+        except redis.RedisError:
+            _mark_redis_down()
+            cache_key = None
+
+    if body is None:
+        adapter = _get_adapter(model)
+        body = adapter.dump_json(adapter.validate_python(build()))
+        if cache_key is not None:
+            try:
+                client.setex(cache_key, ttl, body)
+            except redis.RedisError:
+                _mark_redis_down()
+
+    headers = {"ETag": make_etag(body), "Cache-Control": f"public, max-age={ttl}"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -29,6 +29,9 @@ class Settings(BaseSettings):
 
     database_url: str = f"duckdb:///{PROJECT_ROOT}/src/webapp/baller.duckdb"
     database_echo: bool = False
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_query_cache_size: int = 1024
 
     @property
     def duckdb_path(self) -> Path:
@@ -43,6 +46,8 @@ class Settings(BaseSettings):
 
     meilisearch_url: str = "http://localhost:7700"
     meilisearch_api_key: str = ""
+    meilisearch_batch_size: int = 5000
+    meilisearch_max_inflight_batches: int = 4
 
     scraper_base_url: str = "https://www.basketball-reference.com"
     scraper_rate_limit_seconds: float = 3.0
@@ -8,6 +8,7 @@ from contextlib import contextmanager
 
 import duckdb
 
+from app.core.config import settings
 from app.db.session import engine
 
 _conn: duckdb.DuckDBPyConnection | None = None
@@ -26,6 +27,21 @@ def get_connection() -> duckdb.DuckDBPyConnection:
     return _conn
 
 
+def database_version() -> int:
+    """Get the DuckDB file's modification time, or 0 if it is missing.
+
+    An ETL build rewrites the database file, so process-local caches compare
+    this value to notice that their rows are out of date.
+
+    Returns:
+        int: The file's ``st_mtime_ns``.
+    """
+    try:
+        return settings.duckdb_path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def close_connection():
     """Close the active database connection.
 
@@ -6,15 +6,10 @@ LIST_GAMES = """
         g.away_team_id,
         g.home_score,
         g.away_score,
-        g.season_year,
         g.season_type,
-        t_home.abbreviation as home_team_abbrev,
-        t_away.abbreviation as away_team_abbrev,
         g.arena,
         g.attendance
     FROM games g
-    LEFT JOIN dim_teams t_home ON g.home_team_id = t_home.team_id
-    LEFT JOIN dim_teams t_away ON g.away_team_id = t_away.team_id
     WHERE 1=1
 """
 
@@ -26,16 +21,10 @@ GET_GAME_BY_ID = """
         g.away_team_id,
         g.home_score,
         g.away_score,
-        g.season_year,
         g.season_type,
-        t_home.abbreviation as home_team_abbrev,
-        t_away.abbreviation as away_team_abbrev,
         g.arena,
-        g.attendance,
-        g.duration_minutes
+        g.attendance
     FROM games g
-    LEFT JOIN dim_teams t_home ON g.home_team_id = t_home.team_id
-    LEFT JOIN dim_teams t_away ON g.away_team_id = t_away.team_id
     WHERE g.game_id = ?
 """
 
@@ -51,6 +40,17 @@ GET_PLAYER_BOX_SCORES = """
     ORDER BY pg.team_id, pg.minutes_played DESC
 """
 
+# One round trip for a box score page: the game row as a struct column, joined
+# to its player lines (a single NULL line when none exist).
+GET_BOX_SCORE = f"""
+    SELECT game, box.*
+    FROM ({GET_GAME_BY_ID}) game
+    LEFT JOIN ({GET_PLAYER_BOX_SCORES}) box ON TRUE
+    ORDER BY box.team_id, box.minutes_played DESC
+"""
+
 GET_PLAY_BY_PLAY = """
-    SELECT * FROM play_by_play WHERE game_id = ? ORDER BY period, seconds_remaining DESC
+    SELECT * FROM play_by_play WHERE game_id = ?
 """
+
+PLAY_BY_PLAY_ORDER = " ORDER BY period, seconds_remaining DESC"
@@ -23,9 +23,12 @@ GET_PLAYER_BY_SLUG = """
     WHERE p.slug = ?
 """
 
+# player_name rides along on every row so the game log needs no separate
+# player lookup; it is stripped from the game dicts.
 GET_PLAYER_GAME_LOG = """
     SELECT
         pg.*,
+        (p.first_name || ' ' || p.last_name) as player_name,
         g.date as game_date,
         t.abbreviation as opponent_abbrev,
         CASE WHEN g.home_team_id = pg.team_id THEN 'HOME' ELSE 'AWAY' END as location,
@@ -51,9 +54,39 @@ GET_PLAYER_CAREER_STATS = """
         SUM(ps.assists) as assists,
         SUM(ps.rebounds_total) as total_rebounds
     FROM fact_player_gamelogs ps
-    JOIN dim_players p ON ps.player_id = p.player_id
     LEFT JOIN dim_teams t ON ps.team_id = t.team_id
-    WHERE p.slug = ?
+    WHERE ps.player_id = (SELECT player_id FROM dim_players WHERE slug = ?)
     GROUP BY ps.season_year, ps.season_type, ps.team_id, t.abbreviation
     ORDER BY ps.season_year DESC
 """
+
+# Home/away and win/loss totals and per-game averages in one pass: each
+# grouping set yields one row per split, with the other split column NULL.
+GET_PLAYER_SPLITS = """
+    WITH logs AS (
+        SELECT
+            pg.points_scored,
+            pg.rebounds_total,
+            pg.assists,
+            CASE WHEN g.home_team_id = pg.team_id THEN 'home' ELSE 'away' END
+                as location,
+            CASE WHEN (g.home_team_id = pg.team_id AND g.home_score > g.away_score) OR
+                      (g.away_team_id = pg.team_id AND g.away_score > g.home_score)
+                 THEN 'wins' ELSE 'losses' END as outcome
+        FROM fact_player_gamelogs pg
+        JOIN dim_games g ON pg.game_id = g.game_id
+        WHERE pg.player_id = (SELECT player_id FROM dim_players WHERE slug = ?)
+          AND pg.season_year = ? AND pg.season_type = ?
+    )
+    SELECT
+        COALESCE(location, outcome) as split,
+        COUNT(*) as games_played,
+        SUM(points_scored) as points,
+        SUM(rebounds_total) as rebounds,
+        SUM(assists) as assists,
+        ROUND(SUM(points_scored) / COUNT(*), 1) as ppg,
+        ROUND(SUM(rebounds_total) / COUNT(*), 1) as rpg,
+        ROUND(SUM(assists) / COUNT(*), 1) as apg
+    FROM logs
+    GROUP BY GROUPING SETS ((location), (outcome))
+"""
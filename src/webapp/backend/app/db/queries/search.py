@@ -1,26 +1,69 @@
+# The search fallbacks select only the fields the search and autocomplete
+# responses render.
 SEARCH_PLAYERS_DB = """
     SELECT
-        p.*,
-        (p.first_name || ' ' || p.last_name) as full_name
+        p.player_id,
+        p.slug,
+        (p.first_name || ' ' || p.last_name) as full_name,
+        p.position,
+        p.is_active,
+        p.debut_year,
+        p.final_year
     FROM dim_players p
     WHERE
-        p.first_name ILIKE ? OR
-        p.last_name ILIKE ?
+        p.first_name ILIKE ? ESCAPE '\\' OR
+        p.last_name ILIKE ? ESCAPE '\\'
+    LIMIT ?
+"""
+
+# Multi-word queries ("LeBron James") match across the first/last name boundary.
+SEARCH_PLAYERS_BY_FULL_NAME_DB = """
+    SELECT
+        p.player_id,
+        p.slug,
+        (p.first_name || ' ' || p.last_name) as full_name,
+        p.position,
+        p.is_active,
+        p.debut_year,
+        p.final_year
+    FROM dim_players p
+    WHERE (p.first_name || ' ' || p.last_name) ILIKE ? ESCAPE '\\'
     LIMIT ?
 """
 
 SEARCH_TEAMS_DB = """
     SELECT
-        t.*,
-        (t.city || ' ' || t.name) as full_name
+        t.team_id,
+        t.abbreviation,
+        t.name,
+        t.city,
+        t.is_active
     FROM dim_teams t
     WHERE
-        t.name ILIKE ? OR
-        t.city ILIKE ? OR
-        t.abbreviation ILIKE ?
+        t.name ILIKE ? ESCAPE '\\' OR
+        t.city ILIKE ? ESCAPE '\\' OR
+        t.abbreviation ILIKE ? ESCAPE '\\'
     LIMIT ?
 """
 
+
+def _autocomplete_query(players_query: str) -> str:
+    """Union a player search with the team search as suggestion rows."""
+    return f"""
+    SELECT 'player' as type, p.player_id as id, p.slug, p.full_name as text,
+           p.position as subtitle
+    FROM ({players_query}) p
+    UNION ALL
+    SELECT 'team' as type, t.team_id as id, NULL as slug,
+           concat_ws(' ', t.city, t.name) as text, t.abbreviation as subtitle
+    FROM ({SEARCH_TEAMS_DB}) t
+"""
+
+
+# Autocomplete fallback: player and team suggestions in one round trip
+AUTOCOMPLETE_DB = _autocomplete_query(SEARCH_PLAYERS_DB)
+AUTOCOMPLETE_BY_FULL_NAME_DB = _autocomplete_query(SEARCH_PLAYERS_BY_FULL_NAME_DB)
+
 INDEX_ALL_GAMES = """
     SELECT g.* FROM games g
 """
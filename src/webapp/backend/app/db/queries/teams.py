@@ -11,19 +11,6 @@ LIST_TEAMS = """
     WHERE 1=1
 """
 
-GET_TEAM_BY_ABBREVIATION = """
-    SELECT
-        team_id,
-        abbreviation,
-        name,
-        city,
-        arena,
-        1900 as founded_year, -- Placeholder
-        TRUE as is_active     -- Placeholder
-    FROM dim_teams
-    WHERE abbreviation = ?
-"""
-
 GET_TEAM_ID = """
     SELECT team_id FROM dim_teams WHERE abbreviation = ?
 """
@@ -45,21 +32,29 @@ GET_TEAM_ROSTER = """
 """
 
 GET_TEAM_SCHEDULE = """
+    WITH team_games AS (
+        SELECT
+            g.game_id,
+            g.date,
+            CASE WHEN g.home_team_id = ? THEN g.home_score ELSE g.away_score END as team_score,
+            CASE WHEN g.home_team_id = ? THEN g.away_score ELSE g.home_score END as opponent_score,
+            CASE WHEN g.home_team_id = ? THEN 'HOME' ELSE 'AWAY' END as location,
+            CASE WHEN g.home_team_id = ? THEN g.away_team_id ELSE g.home_team_id END as opponent_id
+        FROM games g
+        WHERE (g.home_team_id = ? OR g.away_team_id = ?)
+          AND g.season_year = ?
+    )
     SELECT
-        g.game_id,
-        g.date,
-        CASE WHEN g.home_team_id = ? THEN g.home_score ELSE g.away_score END as team_score,
-        CASE WHEN g.home_team_id = ? THEN g.away_score ELSE g.home_score END as opponent_score,
-        CASE WHEN g.home_team_id = ? THEN 'HOME' ELSE 'AWAY' END as location,
-        CASE WHEN (g.home_team_id = ? AND g.home_score > g.away_score) OR
-                  (g.away_team_id = ? AND g.away_score > g.home_score)
-             THEN 'W' ELSE 'L' END as result,
+        tg.game_id,
+        tg.date,
+        tg.team_score,
+        tg.opponent_score,
+        tg.location,
+        CASE WHEN tg.team_score > tg.opponent_score THEN 'W' ELSE 'L' END as result,
         t_opp.abbreviation as opponent_abbrev
-    FROM games g
-    JOIN dim_teams t_opp ON (CASE WHEN g.home_team_id = ? THEN g.away_team_id ELSE g.home_team_id END) = t_opp.team_id
-    WHERE (g.home_team_id = ? OR g.away_team_id = ?)
-      AND g.season_year = ?
-    ORDER BY g.date
+    FROM team_games tg
+    JOIN dim_teams t_opp ON tg.opponent_id = t_opp.team_id
+    ORDER BY tg.date
 """
 
 GET_TEAM_SEASON_STATS = """
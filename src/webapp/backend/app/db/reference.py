@@ -0,0 +1,80 @@
+"""Process-local cache for small, static reference tables.
+
+The team dimension holds a few dozen rows that almost every response needs
+to resolve ``team_id`` to an abbreviation or vice versa. It is loaded once
+per process and served from dictionaries instead of being joined into every
+query. The cache remembers the database file version it was loaded from and
+reloads once an ETL build replaces the file.
+"""
+
+import duckdb
+
+from app.db.connection import database_version
+from app.db.queries import teams as team_queries
+
+_teams_by_id: dict[int, dict] | None = None
+_teams_by_abbreviation: dict[str, dict] | None = None
+_teams_version: int | None = None
+
+
+def _teams_stale() -> bool:
+    """Check whether the team cache is empty or predates the database file."""
+    return _teams_by_id is None or _teams_version != database_version()
+
+
+def load_teams(conn: duckdb.DuckDBPyConnection) -> dict[int, dict]:
+    """Load the team table into the process cache.
+
+    Args:
+        conn: DuckDB database connection.
+
+    Returns:
+        dict[int, dict]: Team rows keyed by team_id.
+    """
+    global _teams_by_id, _teams_by_abbreviation, _teams_version  # noqa: PLW0603
+    _teams_version = database_version()
+    result = conn.execute(team_queries.LIST_TEAMS).fetchall()
+    columns = [desc[0] for desc in conn.description]
+    teams = [dict(zip(columns, row, strict=False)) for row in result]
+    _teams_by_abbreviation = {team["abbreviation"]: team for team in teams}
+    _teams_by_id = {team["team_id"]: team for team in teams}
+    return _teams_by_id
+
+
+def get_teams_by_id(conn: duckdb.DuckDBPyConnection) -> dict[int, dict]:
+    """Get cached team rows keyed by team_id, loading them on first use.
+
+    Args:
+        conn: DuckDB database connection.
+
+    Returns:
+        dict[int, dict]: Team rows keyed by team_id.
+    """
+    if _teams_stale():
+        return load_teams(conn)
+    return _teams_by_id
+
+
+def get_team_by_abbreviation(
+    conn: duckdb.DuckDBPyConnection, abbreviation: str
+) -> dict | None:
+    """Look up a cached team row by abbreviation.
+
+    Args:
+        conn: DuckDB database connection.
+        abbreviation: Upper-case team abbreviation (e.g., 'LAL').
+
+    Returns:
+        dict | None: The team row, or None if no team matches.
+    """
+    if _teams_stale():
+        load_teams(conn)
+    return _teams_by_abbreviation.get(abbreviation)
+
+
+def clear_reference_cache() -> None:
+    """Drop the cached reference tables so they reload on next access."""
+    global _teams_by_id, _teams_by_abbreviation, _teams_version  # noqa: PLW0603
+    _teams_by_id = None
+    _teams_by_abbreviation = None
+    _teams_version = None
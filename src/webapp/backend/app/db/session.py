@@ -17,6 +17,13 @@ engine = create_engine(
     settings.database_url,
     echo=settings.database_echo,
     connect_args=connect_args,
+    # Keep enough pooled connections for the request threadpool so bursts reuse
+    # open DuckDB handles instead of reopening the database file.
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    # Compiled-statement cache shared by ORM queries; sized above the default 500
+    # so every distinct hot query shape stays compiled.
+    query_cache_size=settings.database_query_cache_size,
     future=True,
 )
 
@@ -7,13 +7,20 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.db.connection import get_connection
+from app.db.reference import load_teams
 from app.db.session import init_db
+from app.search.client import close_http_client
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     init_db()
+    load_teams(get_connection())
+    # Build the OpenAPI schema once so /openapi.json never regenerates it.
+    app.openapi()
     yield
+    close_http_client()
 
 
 app = FastAPI(
@@ -1,17 +1,50 @@
-"""Database models package."""
-
-from app.models.award import Award, AwardRecipient
-from app.models.draft import Draft, DraftPick
-from app.models.game import BoxScore, Game, PlayByPlay
-from app.models.player import (
-    Player,
-    PlayerBoxScore,
-    PlayerSeason,
-    PlayerSeasonAdvanced,
-    PlayerShooting,
-)
-from app.models.season import Conference, Division, League, Season
-from app.models.team import Franchise, Team, TeamSeason
+"""Database models package.
+
+Models are imported lazily on first attribute access (PEP 562) so that
+importing one submodule, e.g. ``app.models.season``, does not register every
+table with SQLModel's metadata.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.models.award import Award, AwardRecipient
+    from app.models.draft import Draft, DraftPick
+    from app.models.game import BoxScore, Game, PlayByPlay
+    from app.models.player import (
+        Player,
+        PlayerBoxScore,
+        PlayerSeason,
+        PlayerSeasonAdvanced,
+        PlayerShooting,
+    )
+    from app.models.season import Conference, Division, League, Season
+    from app.models.team import Franchise, Team, TeamSeason
+
+_LAZY_MODELS = {
+    "Award": "app.models.award",
+    "AwardRecipient": "app.models.award",
+    "BoxScore": "app.models.game",
+    "Conference": "app.models.season",
+    "Division": "app.models.season",
+    "Draft": "app.models.draft",
+    "DraftPick": "app.models.draft",
+    "Franchise": "app.models.team",
+    "Game": "app.models.game",
+    "League": "app.models.season",
+    "PlayByPlay": "app.models.game",
+    "Player": "app.models.player",
+    "PlayerBoxScore": "app.models.player",
+    "PlayerSeason": "app.models.player",
+    "PlayerSeasonAdvanced": "app.models.player",
+    "PlayerShooting": "app.models.player",
+    "Season": "app.models.season",
+    "Team": "app.models.team",
+    "TeamSeason": "app.models.team",
+}
 
 __all__ = [
     "Award",
@@ -34,3 +67,17 @@ __all__ = [
     "Team",
     "TeamSeason",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -29,7 +29,9 @@ class Draft(SQLModel, table=True):
     round_count: int
     pick_count: int
 
-    picks: list["DraftPick"] = Relationship(back_populates="draft")
+    picks: list["DraftPick"] = Relationship(
+        back_populates="draft", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class DraftPick(SQLModel, table=True):
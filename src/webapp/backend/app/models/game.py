@@ -1,7 +1,6 @@
 """Game-related database models."""
 
 from datetime import date, time
-from decimal import Decimal
 from enum import Enum
 
 from sqlalchemy import JSON
@@ -71,8 +70,14 @@ class Game(SQLModel, table=True):
     box_score_url: str | None = Field(default=None, max_length=255)
     play_by_play_url: str | None = Field(default=None, max_length=255)
 
-    box_scores: list["BoxScore"] = Relationship(back_populates="game")
-    plays: list["PlayByPlay"] = Relationship(back_populates="game")
+    # Two rows per game and always needed together with it; load eagerly.
+    box_scores: list["BoxScore"] = Relationship(
+        back_populates="game", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    # Hundreds of rows per game; load with an explicit option, never lazily.
+    plays: list["PlayByPlay"] = Relationship(
+        back_populates="game", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
 
 
 class BoxScore(SQLModel, table=True):
@@ -104,15 +109,9 @@ class BoxScore(SQLModel, table=True):
     points_scored: int = Field(default=0)
     plus_minus: int | None = None
 
-    field_goal_percentage: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    three_point_percentage: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    free_throw_percentage: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
+    field_goal_percentage: float | None = None
+    three_point_percentage: float | None = None
+    free_throw_percentage: float | None = None
     quarter_scores: dict | None = Field(default=None, sa_type=JSON)
 
     game: Game = Relationship(back_populates="box_scores")
@@ -4,7 +4,10 @@ from datetime import date
 from decimal import Decimal
 from enum import Enum
 
+from pydantic import ConfigDict
+from sqlalchemy import Double, cast, func
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -30,6 +33,7 @@ class SeasonType(str, Enum):
 
 class Player(SQLModel, table=True):
     __tablename__ = "player"
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
 
     player_id: int | None = Field(default=None, primary_key=True)
     slug: str = Field(unique=True, index=True, max_length=20)
@@ -53,22 +57,39 @@ class Player(SQLModel, table=True):
     final_year: int | None = None
     is_active: bool = Field(default=True)
 
-    box_scores: list["PlayerBoxScore"] = Relationship(back_populates="player")
-    seasons: list["PlayerSeason"] = Relationship(back_populates="player")
+    # Thousands of rows per player: callers must ask for these with an explicit
+    # loader option instead of tripping a lazy load per player.
+    box_scores: list["PlayerBoxScore"] = Relationship(
+        back_populates="player", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    # One row per season, so these stay small enough to load eagerly.
+    seasons: list["PlayerSeason"] = Relationship(
+        back_populates="player", sa_relationship_kwargs={"lazy": "selectin"}
+    )
     seasons_advanced: list["PlayerSeasonAdvanced"] = Relationship(
-        back_populates="player"
+        back_populates="player", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    shooting_splits: list["PlayerShooting"] = Relationship(
+        back_populates="player", sa_relationship_kwargs={"lazy": "raise_on_sql"}
     )
-    shooting_splits: list["PlayerShooting"] = Relationship(back_populates="player")
 
-    @property
+    @hybrid_property
     def full_name(self) -> str:
         if self.middle_name:
             return f"{self.first_name} {self.middle_name} {self.last_name}"
         return f"{self.first_name} {self.last_name}"
 
+    @full_name.inplace.expression
+    @classmethod
+    def _full_name_expression(cls):
+        # concat_ws skips NULLs, matching the instance-side middle-name rule,
+        # so queries can filter and sort on Player.full_name in SQL.
+        return func.concat_ws(" ", cls.first_name, cls.middle_name, cls.last_name)
+
 
 class PlayerBoxScore(SQLModel, table=True):
     __tablename__ = "player_box_score"
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
 
     player_id: int = Field(foreign_key="player.player_id", primary_key=True)
     box_id: int = Field(foreign_key="box_score.box_id", primary_key=True)
@@ -95,21 +116,32 @@ class PlayerBoxScore(SQLModel, table=True):
     personal_fouls: int = Field(default=0)
     points_scored: int = Field(default=0)
     plus_minus: int | None = None
-    game_score: Decimal | None = Field(default=None, decimal_places=2, max_digits=6)
+    game_score: float | None = None
 
     player: Player = Relationship(back_populates="box_scores")
 
-    @property
+    @hybrid_property
     def total_rebounds(self) -> int:
         return self.offensive_rebounds + self.defensive_rebounds
 
-    @property
+    @total_rebounds.inplace.expression
+    @classmethod
+    def _total_rebounds_expression(cls):
+        return cls.offensive_rebounds + cls.defensive_rebounds
+
+    @hybrid_property
     def minutes_played(self) -> float:
         return self.seconds_played / 60.0
 
+    @minutes_played.inplace.expression
+    @classmethod
+    def _minutes_played_expression(cls):
+        return cast(cls.seconds_played, Double) / 60.0
+
 
 class PlayerSeason(SQLModel, table=True):
     __tablename__ = "player_season"
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
 
     player_id: int = Field(foreign_key="player.player_id", primary_key=True)
     season_id: int = Field(foreign_key="season.season_id", primary_key=True)
@@ -142,10 +174,16 @@ class PlayerSeason(SQLModel, table=True):
 
     player: Player = Relationship(back_populates="seasons")
 
-    @property
+    @hybrid_property
     def points_per_game(self) -> float:
         return self.points_scored / max(self.games_played, 1)
 
+    @points_per_game.inplace.expression
+    @classmethod
+    def _points_per_game_expression(cls):
+        # Lets leader queries ORDER BY PlayerSeason.points_per_game in SQL.
+        return cast(cls.points_scored, Double) / func.greatest(cls.games_played, 1)
+
 
 class PlayerSeasonAdvanced(SQLModel, table=True):
     __tablename__ = "player_season_advanced"
@@ -159,65 +197,27 @@ class PlayerSeasonAdvanced(SQLModel, table=True):
     games_played: int = Field(default=0)
     minutes_played: int = Field(default=0)
 
-    player_efficiency_rating: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=6
-    )
-    true_shooting_percentage: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    effective_fg_percentage: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    three_point_attempt_rate: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    free_throw_attempt_rate: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=5
-    )
-    usage_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    assist_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    turnover_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    offensive_rebound_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    defensive_rebound_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    total_rebound_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    steal_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    block_percentage: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    offensive_box_plus_minus: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    defensive_box_plus_minus: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    box_plus_minus: Decimal | None = Field(default=None, decimal_places=2, max_digits=5)
-    value_over_replacement_player: Decimal | None = Field(
-        default=None, decimal_places=2, max_digits=5
-    )
-    offensive_win_shares: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=6
-    )
-    defensive_win_shares: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=6
-    )
-    win_shares: Decimal | None = Field(default=None, decimal_places=3, max_digits=6)
-    win_shares_per_48: Decimal | None = Field(
-        default=None, decimal_places=3, max_digits=6
-    )
+    player_efficiency_rating: float | None = None
+    true_shooting_percentage: float | None = None
+    effective_fg_percentage: float | None = None
+    three_point_attempt_rate: float | None = None
+    free_throw_attempt_rate: float | None = None
+    usage_percentage: float | None = None
+    assist_percentage: float | None = None
+    turnover_percentage: float | None = None
+    offensive_rebound_percentage: float | None = None
+    defensive_rebound_percentage: float | None = None
+    total_rebound_percentage: float | None = None
+    steal_percentage: float | None = None
+    block_percentage: float | None = None
+    offensive_box_plus_minus: float | None = None
+    defensive_box_plus_minus: float | None = None
+    box_plus_minus: float | None = None
+    value_over_replacement_player: float | None = None
+    offensive_win_shares: float | None = None
+    defensive_win_shares: float | None = None
+    win_shares: float | None = None
+    win_shares_per_48: float | None = None
     is_combined_totals: bool = Field(default=False)
 
     player: Player = Relationship(back_populates="seasons_advanced")
@@ -231,6 +231,6 @@ class PlayerShooting(SQLModel, table=True):
     distance_range: str = Field(primary_key=True, max_length=20)
     fg_made: int = Field(default=0)
     fg_attempted: int = Field(default=0)
-    fg_percentage: Decimal | None = Field(default=None, decimal_places=3, max_digits=5)
+    fg_percentage: float | None = None
 
     player: Player = Relationship(back_populates="shooting_splits")
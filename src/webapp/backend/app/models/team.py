@@ -15,7 +15,9 @@ class Franchise(SQLModel, table=True):
     defunct_year: int | None = None
     city: str | None = Field(default=None, max_length=100)
 
-    teams: list["Team"] = Relationship(back_populates="franchise")
+    teams: list["Team"] = Relationship(
+        back_populates="franchise", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
 
 
 class Team(SQLModel, table=True):
@@ -35,8 +37,14 @@ class Team(SQLModel, table=True):
     arena_capacity: int | None = None
     relocation_history: dict | None = Field(default=None, sa_type=JSON)
 
-    franchise: Franchise = Relationship(back_populates="teams")
-    seasons: list["TeamSeason"] = Relationship(back_populates="team")
+    # Team rows are loaded for standings and lists; their related rows must be
+    # requested with an explicit loader option rather than loaded per team.
+    franchise: Franchise = Relationship(
+        back_populates="teams", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    seasons: list["TeamSeason"] = Relationship(
+        back_populates="team", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
 
 
 class TeamSeason(SQLModel, table=True):
@@ -41,9 +41,10 @@ class PlayerDetail(PlayerBase):
 class PlayerList(BaseModel):
     items: list[PlayerSummary]
     total: int
-    page: int
+    page: int | None
     per_page: int
     pages: int
+    next_cursor: str | None = None
 
 
 class PlayerBoxScoreResponse(BaseModel):
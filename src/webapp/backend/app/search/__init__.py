@@ -1,9 +1,11 @@
 """Search package for Meilisearch integration."""
 
-from app.search.client import get_meilisearch_client
-from app.search.indexer import SearchIndexer
+from app.search.client import get_http_client, get_meilisearch_client
+from app.search.indexer import SearchIndexer, get_search_indexer
 
 __all__ = [
     "SearchIndexer",
+    "get_http_client",
     "get_meilisearch_client",
+    "get_search_indexer",
 ]
@@ -1,7 +1,9 @@
 """Meilisearch client configuration."""
 
 from functools import lru_cache
+from typing import Any
 
+import httpx
 import meilisearch
 from meilisearch import Client
 
@@ -21,6 +23,37 @@ def get_meilisearch_client() -> Client:
     )
 
 
+@lru_cache
+def get_http_client() -> httpx.Client:
+    """Get the shared keep-alive HTTP client for Meilisearch's hot endpoints.
+
+    The meilisearch client opens a new connection for every call, so search
+    requests go through this pooled client instead.
+
+    Returns:
+        httpx.Client bound to the Meilisearch base URL.
+    """
+    headers = {}
+    if settings.meilisearch_api_key:
+        headers["Authorization"] = f"Bearer {settings.meilisearch_api_key}"
+    return httpx.Client(
+        base_url=settings.meilisearch_url,
+        headers=headers,
+        timeout=10.0,
+        transport=httpx.HTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=50, keepalive_expiry=60),
+        ),
+    )
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+        get_http_client.cache_clear()
+
+
 # Index names
 PLAYERS_INDEX = "players"
 TEAMS_INDEX = "teams"
@@ -128,3 +161,22 @@ INDEX_CONFIGS = {
         ],
     },
 }
+
+
+def _index_settings(config: dict[str, Any]) -> dict[str, Any]:
+    """Build the ``update_settings`` payload for one index configuration."""
+    index_settings = {
+        "searchableAttributes": config.get("searchableAttributes", ["*"]),
+        "filterableAttributes": config.get("filterableAttributes", []),
+        "sortableAttributes": config.get("sortableAttributes", []),
+        "displayedAttributes": config.get("displayedAttributes", ["*"]),
+    }
+    if "rankingRules" in config:
+        index_settings["rankingRules"] = config["rankingRules"]
+    return index_settings
+
+
+# Settings payloads, built once at import
+INDEX_SETTINGS: dict[str, dict[str, Any]] = {
+    index_name: _index_settings(config) for index_name, config in INDEX_CONFIGS.items()
+}
@@ -1,94 +1,198 @@
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, singledispatch
+from operator import itemgetter
+from threading import Lock
 from typing import Any
 
 import duckdb
+import httpx
+import orjson
 import structlog
+from cachetools import TTLCache
 from meilisearch import Client
 from meilisearch.errors import MeilisearchApiError
 
+from app.core.config import settings
 from app.db.queries import search as search_queries
 from app.search.client import (
     GAMES_INDEX,
     INDEX_CONFIGS,
+    INDEX_SETTINGS,
     PLAYERS_INDEX,
     TEAMS_INDEX,
+    get_http_client,
     get_meilisearch_client,
 )
 
 logger = structlog.get_logger(__name__)
 
+PLAYER_DOCUMENT_FIELDS = (
+    "player_id",
+    "slug",
+    "first_name",
+    "last_name",
+    "full_name",
+    "position",
+    "is_active",
+    "college",
+    "draft_year",
+    "debut_year",
+    "final_year",
+)
+TEAM_DOCUMENT_FIELDS = (
+    "team_id",
+    "name",
+    "city",
+    "abbreviation",
+    "full_name",
+    "is_active",
+)
+GAME_DOCUMENT_FIELDS = (
+    "game_id",
+    "game_date",
+    "home_team_id",
+    "away_team_id",
+    "home_score",
+    "away_score",
+    "season_type",
+)
+
+# Shared by all indexers so per-request searches reuse threads.
+_search_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="meilisearch")
+
+# Recent search results per process. Entries expire after a minute, which also
+# bounds staleness after a reindex in another process.
+_search_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_search_cache_lock = Lock()
+
+
+def clear_search_cache() -> None:
+    """Drop this process's cached search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+@singledispatch
+def _render_filter(_value: object, _field: str) -> str:
+    """Render one ``field <op> value`` Meilisearch filter; unsupported types skip."""
+    return ""
+
+
+@_render_filter.register
+def _render_bool(value: bool, field: str) -> str:
+    return f"{field} = {'true' if value else 'false'}"
+
+
+@_render_filter.register(int)
+@_render_filter.register(float)
+def _render_number(value: float, field: str) -> str:
+    return f"{field} = {value}"
+
+
+@_render_filter.register
+def _render_str(value: str, field: str) -> str:
+    return f'{field} = "{value}"'
+
+
+@_render_filter.register
+def _render_list(value: list, field: str) -> str:
+    values = ", ".join(f'"{v}"' if isinstance(v, str) else str(v) for v in value)
+    return f"{field} IN [{values}]"
+
+
+def _row_getter(indices: list[int]) -> Callable[[tuple], tuple]:
+    """Build a getter returning the given row positions as a tuple."""
+    if len(indices) == 1:
+        (index,) = indices
+        return lambda row: (row[index],)
+    return itemgetter(*indices)
+
 
 class SearchIndexer:
-    def __init__(self, client: Client | None = None):
+    def __init__(
+        self, client: Client | None = None, http_client: httpx.Client | None = None
+    ):
         self.client = client or get_meilisearch_client()
+        self.http = http_client or get_http_client()
 
     def setup_indices(self) -> None:
-        for index_name, config in INDEX_CONFIGS.items():
-            logger.info("Setting up index", index=index_name)
+        """Create every index and apply its settings, all indices in parallel.
+
+        Call this before the first ``index_*`` call: Meilisearch indexes
+        documents faster when settings are in place than when it has to
+        re-index them after a settings change.
+        """
+        with ThreadPoolExecutor(max_workers=len(INDEX_CONFIGS)) as pool:
+            futures = [
+                pool.submit(self._setup_index, index_name, config)
+                for index_name, config in INDEX_CONFIGS.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _setup_index(self, index_name: str, config: dict[str, Any]) -> None:
+        logger.info("Setting up index", index=index_name)
 
-            try:
-                self.client.create_index(
-                    index_name,
-                    {"primaryKey": config["primaryKey"]},
-                )
-            except MeilisearchApiError as e:
-                if "index_already_exists" not in str(e):
-                    raise
-                logger.info("Index already exists", index=index_name)
-
-            index = self.client.index(index_name)
-
-            settings = {
-                "searchableAttributes": config.get("searchableAttributes", ["*"]),
-                "filterableAttributes": config.get("filterableAttributes", []),
-                "sortableAttributes": config.get("sortableAttributes", []),
-                "displayedAttributes": config.get("displayedAttributes", ["*"]),
-            }
-
-            if "rankingRules" in config:
-                settings["rankingRules"] = config["rankingRules"]
-
-            index.update_settings(settings)
-            logger.info("Updated index settings", index=index_name)
+        try:
+            self.client.create_index(
+                index_name,
+                {"primaryKey": config["primaryKey"]},
+            )
+        except MeilisearchApiError as e:
+            if "index_already_exists" not in str(e):
+                raise
+            logger.info("Index already exists", index=index_name)
+
+        index = self.client.index(index_name)
+        desired = INDEX_SETTINGS[index_name]
+        # A settings update is an index task that can re-index every document,
+        # so skip it when the live settings already match.
+        current = index.get_settings()
+        if all(current.get(key) == value for key, value in desired.items()):
+            logger.info("Index settings unchanged", index=index_name)
+            return
+
+        index.update_settings(desired)
+        logger.info("Updated index settings", index=index_name)
 
     def index_players(
-        self, conn: duckdb.DuckDBPyConnection, _batch_size: int = 1000
+        self, conn: duckdb.DuckDBPyConnection, batch_size: int | None = None
     ) -> int:
         logger.info("Starting player indexing")
 
-        result = conn.execute(search_queries.INDEX_ALL_PLAYERS).fetchall()
-        columns = [desc[0] for desc in conn.description]
-        players = [dict(zip(columns, row, strict=False)) for row in result]
+        count = self._index_in_batches(
+            conn.execute(search_queries.INDEX_ALL_PLAYERS),
+            PLAYERS_INDEX,
+            "player_id",
+            PLAYER_DOCUMENT_FIELDS,
+            batch_size=batch_size,
+        )
+        if count:
+            logger.info("Indexed players", count=count)
 
-        documents = [self._player_to_document(p) for p in players]
-
-        if documents:
-            index = self.client.index(PLAYERS_INDEX)
-            index.add_documents(documents, primary_key="player_id")
-            logger.info("Indexed players", count=len(documents))
-
-        return len(documents)
+        return count
 
     def index_teams(self, conn: duckdb.DuckDBPyConnection) -> int:
         logger.info("Starting team indexing")
 
-        result = conn.execute(search_queries.INDEX_ALL_TEAMS).fetchall()
-        columns = [desc[0] for desc in conn.description]
-        teams = [dict(zip(columns, row, strict=False)) for row in result]
-
-        documents = [self._team_to_document(t) for t in teams]
-
-        if documents:
-            index = self.client.index(TEAMS_INDEX)
-            index.add_documents(documents, primary_key="team_id")
-            logger.info("Indexed teams", count=len(documents))
+        count = self._index_in_batches(
+            conn.execute(search_queries.INDEX_ALL_TEAMS),
+            TEAMS_INDEX,
+            "team_id",
+            TEAM_DOCUMENT_FIELDS,
+        )
+        if count:
+            logger.info("Indexed teams", count=count)
 
-        return len(documents)
+        return count
 
     def index_games(
         self,
         conn: duckdb.DuckDBPyConnection,
         season_year: int | None = None,
-        _batch_size: int = 1000,
+        batch_size: int | None = None,
     ) -> int:
         logger.info("Starting game indexing", season_year=season_year)
 
@@ -98,26 +202,70 @@ class SearchIndexer:
             query += " WHERE season_year = ?"
             params.append(season_year)
 
-        result = conn.execute(query, params).fetchall()
-        columns = [desc[0] for desc in conn.description]
-        games = [dict(zip(columns, row, strict=False)) for row in result]
+        count = self._index_in_batches(
+            conn.execute(query, params),
+            GAMES_INDEX,
+            "game_id",
+            GAME_DOCUMENT_FIELDS,
+            batch_size=batch_size,
+            finish=self._finish_game_document,
+        )
+        if count:
+            logger.info("Indexed games", count=count)
 
-        documents = [self._game_to_document(g) for g in games]
+        return count
 
-        if documents:
-            index = self.client.index(GAMES_INDEX)
-            index.add_documents(documents, primary_key="game_id")
-            logger.info("Indexed games", count=len(documents))
-
-        return len(documents)
+    def _index_in_batches(  # noqa: PLR0913
+        self,
+        cursor: duckdb.DuckDBPyConnection,
+        index_name: str,
+        primary_key: str,
+        fields: tuple[str, ...],
+        *,
+        batch_size: int | None = None,
+        finish: Callable[[dict[str, Any]], None] | None = None,
+    ) -> int:
+        # Fetch and push one batch at a time so memory stays bounded by
+        # batch_size rather than the size of the table. Uploads run on a small
+        # pool so the next fetch overlaps the previous POST, with at most
+        # meilisearch_max_inflight_batches payloads in flight.
+        batch_size = batch_size or settings.meilisearch_batch_size
+        max_inflight = settings.meilisearch_max_inflight_batches
+        # Documents are built straight from the row tuples: an itemgetter picks
+        # the document's columns and fields the query lacks are filled with None.
+        positions = {desc[0]: i for i, desc in enumerate(cursor.description)}
+        present = tuple(field for field in fields if field in positions)
+        missing = dict.fromkeys(field for field in fields if field not in positions)
+        get = _row_getter([positions[field] for field in present])
+        count = 0
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=max_inflight) as pool:
+            while rows := cursor.fetchmany(batch_size):
+                documents = [
+                    dict(zip(present, get(row), strict=True), **missing) for row in rows
+                ]
+                if finish is not None:
+                    for document in documents:
+                        finish(document)
+                if len(pending) >= max_inflight:
+                    pending.popleft().result()
+                pending.append(
+                    pool.submit(self._add_documents, index_name, documents, primary_key)
+                )
+                count += len(documents)
+            for future in pending:
+                future.result()
+        return count
 
     def delete_player(self, player_id: int) -> None:
         index = self.client.index(PLAYERS_INDEX)
         index.delete_document(player_id)
+        clear_search_cache()
 
     def delete_team(self, team_id: int) -> None:
         index = self.client.index(TEAMS_INDEX)
         index.delete_document(team_id)
+        clear_search_cache()
 
     def search_players(
         self,
@@ -148,129 +296,156 @@ class SearchIndexer:
         self,
         query: str,
         limit_per_index: int = 5,
+        entity_type: str | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        results = {
-            "players": [],
-            "teams": [],
-            "games": [],
+        # Only search the indices the caller will render.
+        index_names = {
+            "player": PLAYERS_INDEX,
+            "team": TEAMS_INDEX,
+            "game": GAMES_INDEX,
+        }
+        if entity_type is not None:
+            index_names = {entity_type: index_names[entity_type]}
+        hits = self._search_indices(
+            query, dict.fromkeys(index_names.values(), limit_per_index)
+        )
+        return {
+            "players": hits.get(PLAYERS_INDEX, []),
+            "teams": hits.get(TEAMS_INDEX, []),
+            "games": hits.get(GAMES_INDEX, []),
         }
-
-        try:
-            player_results = self.search_players(query, limit=limit_per_index)
-            results["players"] = player_results.get("hits", [])
-        except Exception as e:
-            logger.warning("Player search failed", error=str(e))
-
-        try:
-            team_results = self.search_teams(query, limit=limit_per_index)
-            results["teams"] = team_results.get("hits", [])
-        except Exception as e:
-            logger.warning("Team search failed", error=str(e))
-
-        try:
-            game_index = self.client.index(GAMES_INDEX)
-            game_results = game_index.search(query, {"limit": limit_per_index})
-            results["games"] = game_results.get("hits", [])
-        except Exception as e:
-            logger.warning("Game search failed", error=str(e))
-
-        return results
 
     def get_autocomplete_suggestions(
         self,
         query: str,
         limit: int = 8,
     ) -> list[dict[str, Any]]:
-        suggestions = []
+        hits = self._search_indices(
+            query, {PLAYERS_INDEX: limit // 2, TEAMS_INDEX: limit // 2}
+        )
+
+        suggestions = [
+            {
+                "type": "player",
+                "id": hit.get("player_id"),
+                "slug": hit.get("slug"),
+                "text": hit.get("full_name"),
+                "subtitle": (hit.get("position") or "").replace("_", " "),
+                "url": f"/players/{hit.get('slug')}",
+            }
+            for hit in hits[PLAYERS_INDEX]
+        ]
+        suggestions.extend(
+            {
+                "type": "team",
+                "id": hit.get("team_id"),
+                "text": hit.get("full_name") or f"{hit.get('city')} {hit.get('name')}",
+                "subtitle": hit.get("abbreviation"),
+                "url": f"/teams/{hit.get('abbreviation')}",
+            }
+            for hit in hits[TEAMS_INDEX]
+        )
 
-        try:
-            player_results = self.search_players(query, limit=limit // 2)
-            suggestions.extend(
-                {
-                    "type": "player",
-                    "id": hit.get("player_id"),
-                    "slug": hit.get("slug"),
-                    "text": hit.get("full_name"),
-                    "subtitle": hit.get("position", "").replace("_", " "),
-                    "url": f"/players/{hit.get('slug')}",
-                }
-                for hit in player_results.get("hits", [])
-            )
-        except Exception as e:
-            logger.warning("Player autocomplete search failed", error=str(e))
+        return suggestions[:limit]
 
+    def _search_indices(
+        self, query: str, limits: dict[str, int]
+    ) -> dict[str, list[dict[str, Any]]]:
+        # Popular prefixes recur across users and keystrokes; serve them from
+        # the short-lived cache before going to Meilisearch.
+        cache_key = (query.lower(), tuple(limits.items()))
+        with _search_cache_lock:
+            cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # One multi-search request instead of a round trip per index. A
+        # multi-search fails as a whole if any index errors, so fall back to
+        # per-index searches to keep the healthy indices' hits. Fallback
+        # results may be partial, so only multi-search responses are cached.
         try:
-            team_results = self.search_teams(query, limit=limit // 2)
-            suggestions.extend(
+            response = self._post(
+                "/multi-search",
                 {
-                    "type": "team",
-                    "id": hit.get("team_id"),
-                    "text": hit.get("full_name")
-                    or f"{hit.get('city')} {hit.get('name')}",
-                    "subtitle": hit.get("abbreviation"),
-                    "url": f"/teams/{hit.get('abbreviation')}",
-                }
-                for hit in team_results.get("hits", [])
+                    "queries": [
+                        {"indexUid": index_name, "q": query, "limit": limit}
+                        for index_name, limit in limits.items()
+                    ]
+                },
             )
         except Exception as e:
-            logger.warning("Team autocomplete search failed", error=str(e))
+            logger.warning("Multi-search failed", error=str(e))
+            return self._search_indices_separately(query, limits)
+
+        hits: dict[str, list[dict[str, Any]]] = {name: [] for name in limits}
+        for result in response.get("results", []):
+            hits[result["indexUid"]] = result.get("hits", [])
+        with _search_cache_lock:
+            _search_cache[cache_key] = hits
+        return hits
+
+    def _search_indices_separately(
+        self, query: str, limits: dict[str, int]
+    ) -> dict[str, list[dict[str, Any]]]:
+        # The searches are independent round trips; run them concurrently.
+        searches = {
+            index_name: _search_pool.submit(
+                self._post,
+                f"/indexes/{index_name}/search",
+                {"q": query, "limit": limit},
+            )
+            for index_name, limit in limits.items()
+        }
 
-        return suggestions[:limit]
+        hits = {}
+        for index_name, future in searches.items():
+            try:
+                hits[index_name] = future.result().get("hits", [])
+            except Exception as e:
+                logger.warning("Search failed", index=index_name, error=str(e))
+                hits[index_name] = []
+        return hits
+
+    def _add_documents(
+        self, index_name: str, documents: list[dict[str, Any]], primary_key: str
+    ) -> None:
+        # Encode with orjson rather than the meilisearch client's json.dumps:
+        # it is much faster on bulk payloads and serializes dates natively.
+        # NDJSON lets Meilisearch parse documents line by line instead of as
+        # one large JSON array.
+        response = self.http.post(
+            f"/indexes/{index_name}/documents",
+            params={"primaryKey": primary_key},
+            content=b"\n".join(map(orjson.dumps, documents)),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        response.raise_for_status()
+
+    def _post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        response = self.http.post(path, json=body)
+        response.raise_for_status()
+        return response.json()
+
+    def _finish_game_document(self, document: dict[str, Any]) -> None:
+        document["is_final"] = document["home_score"] is not None
+        document["matchup"] = f"Game {document['game_id']}"
 
-    def _player_to_document(self, player: dict) -> dict[str, Any]:
-        return {
-            "player_id": player.get("player_id"),
-            "slug": player.get("slug"),
-            "first_name": player.get("first_name"),
-            "last_name": player.get("last_name"),
-            "full_name": player.get("full_name"),
-            "position": player.get("position"),
-            "is_active": player.get("is_active"),
-            "college": player.get("college"),
-            "draft_year": player.get("draft_year"),
-            "debut_year": player.get("debut_year"),
-            "final_year": player.get("final_year"),
-        }
+    def _build_filter_expression(self, filters: dict[str, Any]) -> str:
+        return " AND ".join(
+            expression
+            for field, value in filters.items()
+            if value is not None and (expression := _render_filter(value, field))
+        )
 
-    def _team_to_document(self, team: dict) -> dict[str, Any]:
-        return {
-            "team_id": team.get("team_id"),
-            "name": team.get("name"),
-            "city": team.get("city"),
-            "abbreviation": team.get("abbreviation"),
-            "full_name": team.get("full_name"),
-            "is_active": team.get("is_active"),
-        }
 
-    def _game_to_document(self, game: dict) -> dict[str, Any]:
-        return {
-            "game_id": game.get("game_id"),
-            "game_date": game.get("game_date") if game.get("game_date") else None,
-            "home_team_id": game.get("home_team_id"),
-            "away_team_id": game.get("away_team_id"),
-            "home_score": game.get("home_score"),
-            "away_score": game.get("away_score"),
-            "season_type": game.get("season_type"),
-            "is_final": game.get("home_score") is not None,
-            "matchup": f"Game {game.get('game_id')}",
-        }
+@lru_cache
+def get_search_indexer() -> SearchIndexer:
+    """Get the process-wide indexer.
 
-    def _build_filter_expression(self, filters: dict[str, Any]) -> str:
-        expressions = []
-
-        for field, value in filters.items():
-            if value is None:
-                continue
-            if isinstance(value, bool):
-                expressions.append(f"{field} = {str(value).lower()}")
-            elif isinstance(value, (int, float)):
-                expressions.append(f"{field} = {value}")
-            elif isinstance(value, str):
-                expressions.append(f'{field} = "{value}"')
-            elif isinstance(value, list):
-                values = ", ".join(
-                    f'"{v}"' if isinstance(v, str) else str(v) for v in value
-                )
-                expressions.append(f"{field} IN [{values}]")
+    The indexer holds no per-request state, so API requests and worker tasks
+    share one instance bound to the cached Meilisearch and HTTP clients.
 
-        return " AND ".join(expressions) if expressions else ""
+    Returns:
+        SearchIndexer bound to the shared clients.
+    """
+    return SearchIndexer()
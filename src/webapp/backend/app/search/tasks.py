@@ -3,8 +3,9 @@
 import structlog
 
 from app.celery_app import celery_app
+from app.core.cache import bump_cache_epoch, bump_season_epoch
 from app.db.connection import session
-from app.search.indexer import SearchIndexer
+from app.search.indexer import get_search_indexer
 
 logger = structlog.get_logger(__name__)
 
@@ -12,16 +13,18 @@ logger = structlog.get_logger(__name__)
 def reindex_all():
     """Reindex all data from the database.
 
-    This is a heavy operation that rebuilds all search indices.
+    This is a heavy operation that rebuilds all search indices. It also
+    invalidates every cached API response.
     """
     logger.info("Starting full reindex")
     _reindex_all_sync()
+    bump_cache_epoch()
     logger.info("Full reindex completed")
 
 
 def _reindex_all_sync():
     """Sync implementation of full reindex."""
-    indexer = SearchIndexer()
+    indexer = get_search_indexer()
 
     # Ensure indices are configured
     indexer.setup_indices()
@@ -42,23 +45,25 @@ def _reindex_all_sync():
 
 @celery_app.task(name="app.search.tasks.reindex_players")
 def reindex_players():
-    """Reindex all players."""
+    """Reindex all players and invalidate cached API responses."""
     logger.info("Reindexing players")
-    indexer = SearchIndexer()
+    indexer = get_search_indexer()
     with session() as conn:
         count = indexer.index_players(conn)
         logger.info("Indexed players", count=count)
+    bump_cache_epoch()
     logger.info("Player reindex completed")
 
 
 @celery_app.task(name="app.search.tasks.reindex_teams")
 def reindex_teams():
-    """Reindex all teams."""
+    """Reindex all teams and invalidate cached API responses."""
     logger.info("Reindexing teams")
-    indexer = SearchIndexer()
+    indexer = get_search_indexer()
     with session() as conn:
         count = indexer.index_teams(conn)
         logger.info("Indexed teams", count=count)
+    bump_cache_epoch()
     logger.info("Team reindex completed")
 
 
@@ -66,12 +71,19 @@ def reindex_teams():
 def reindex_games(season_year: int | None = None):
     """Reindex games, optionally for a specific season.
 
+    New games for a season invalidate its cached API responses; a reindex of
+    every season invalidates all of them.
+
     Args:
         season_year: Optional season to reindex.
     """
     logger.info("Reindexing games", season_year=season_year)
-    indexer = SearchIndexer()
+    indexer = get_search_indexer()
     with session() as conn:
         count = indexer.index_games(conn, season_year=season_year)
         logger.info("Indexed games", count=count)
+    if season_year is None:
+        bump_cache_epoch()
+    else:
+        bump_season_epoch(season_year)
     logger.info("Game reindex completed")
@@ -5,10 +5,14 @@ data access operations including listing games, retrieving box scores,
 play-by-play data, and weekly game summaries.
 """
 
+from collections.abc import Iterable, Iterator
 from datetime import UTC, date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
 import duckdb
 
+from app.db import reference
 from app.db.queries import games as game_queries
 
 
@@ -75,8 +79,10 @@ class GameService:
             params.append(end_date)
 
         if team_abbrev:
-            query += " AND (t_home.abbreviation = ? OR t_away.abbreviation = ?)"
-            params.extend([team_abbrev.upper(), team_abbrev.upper()])
+            team = reference.get_team_by_abbreviation(self.conn, team_abbrev.upper())
+            team_id = team["team_id"] if team else None
+            query += " AND (g.home_team_id = ? OR g.away_team_id = ?)"
+            params.extend([team_id, team_id])
 
         if season_year:
             query += " AND g.season_year = ?"
@@ -86,15 +92,26 @@ class GameService:
             query += " AND g.season_type = ?"
             params.append(season_type)
 
-        count_sql = f"SELECT COUNT(*) FROM ({query}) as q"
-        total = self.conn.execute(count_sql, params).fetchone()[0]
-
-        query += " ORDER BY g.date DESC LIMIT ? OFFSET ?"
-        params.extend([per_page, (page - 1) * per_page])
-
-        result = self.conn.execute(query, params).fetchall()
-        columns = [desc[0] for desc in self.conn.description]
-        items = [dict(zip(columns, row, strict=False)) for row in result]
+        # The window count is computed before LIMIT, so the page and the total
+        # come back from a single scan.
+        page_sql = (
+            f"SELECT q.*, COUNT(*) OVER () AS total_count FROM ({query}) as q"
+            " ORDER BY q.game_date DESC LIMIT ? OFFSET ?"
+        )
+        result = self.conn.execute(
+            page_sql, [*params, per_page, (page - 1) * per_page]
+        ).fetchall()
+        columns = [desc[0] for desc in self.conn.description][:-1]
+        items = self._with_team_abbrevs(
+            dict(zip(columns, row[:-1], strict=False)) for row in result
+        )
+
+        if result:
+            total = result[0][-1]
+        else:
+            # A page past the end has no rows to carry the window count.
+            count_sql = f"SELECT COUNT(*) FROM ({query}) as q"
+            total = self.conn.execute(count_sql, params).fetchone()[0]
 
         return {
             "items": items,
@@ -119,7 +136,9 @@ class GameService:
         query = game_queries.LIST_GAMES + " AND g.date = ? ORDER BY g.date"
         result = self.conn.execute(query, [target_date]).fetchall()
         columns = [desc[0] for desc in self.conn.description]
-        return [dict(zip(columns, row, strict=False)) for row in result]
+        return self._with_team_abbrevs(
+            dict(zip(columns, row, strict=False)) for row in result
+        )
 
     def get_game_by_id(self, game_id: int) -> dict | None:
         """Retrieve a single game by its ID.
@@ -136,7 +155,7 @@ class GameService:
             return None
 
         columns = [desc[0] for desc in self.conn.description]
-        return dict(zip(columns, result, strict=False))
+        return self._with_team_abbrevs([dict(zip(columns, result, strict=False))])[0]
 
     def get_box_score(self, game_id: int) -> dict | None:
         """Retrieve player box scores for a specific game.
@@ -151,19 +170,23 @@ class GameService:
                 - away_team: Away team's score and player stats.
             None if game not found.
         """
-        game = self.get_game_by_id(game_id)
-        if not game:
-            return None
-
         rows = self.conn.execute(
-            game_queries.GET_PLAYER_BOX_SCORES, [game_id]
+            game_queries.GET_BOX_SCORE, [game_id, game_id]
         ).fetchall()
+        if not rows:
+            return None
 
-        cols = [desc[0] for desc in self.conn.description]
-        players = [dict(zip(cols, row, strict=False)) for row in rows]
+        cols = [desc[0] for desc in self.conn.description][1:]
+        game = self._with_team_abbrevs([rows[0][0]])[0]
+        players_by_team: dict = {game["home_team_id"]: [], game["away_team_id"]: []}
+        for row in rows:
+            player = dict(zip(cols, row[1:], strict=False))
+            team_players = players_by_team.get(player["team_id"])
+            if team_players is not None:
+                team_players.append(player)
 
-        home_players = [p for p in players if p["team_id"] == game["home_team_id"]]
-        away_players = [p for p in players if p["team_id"] == game["away_team_id"]]
+        home_players = players_by_team[game["home_team_id"]]
+        away_players = players_by_team[game["away_team_id"]]
 
         return {
             "game": game,
@@ -195,12 +218,7 @@ class GameService:
                 - period_filter: Period that was filtered (None if all).
             None if play-by-play table doesn't exist or game not found.
         """
-        query = game_queries.GET_PLAY_BY_PLAY
-        params = [game_id]
-
-        if period is not None:
-            query += " AND period = ?"
-            params.append(period)
+        query, params = self._play_by_play_query(game_id, period)
 
         try:
             result = self.conn.execute(query, params).fetchall()
@@ -212,6 +230,72 @@ class GameService:
 
         return {"game_id": game_id, "plays": plays, "period_filter": period}
 
+    def stream_play_by_play(
+        self, game_id: int, period: int | None = None, batch_size: int = 1000
+    ) -> Iterator[dict] | None:
+        """Stream play-by-play rows for a game without materializing them.
+
+        The query runs on a dedicated cursor so the stream stays valid while
+        other requests use the shared connection.
+
+        Args:
+            game_id: The game's unique identifier.
+            period: Filter for specific period (quarter). None returns all periods.
+            batch_size: Number of rows fetched from the cursor at a time.
+
+        Returns:
+            Iterator[dict] | None: Lazily fetched play events, or None if the
+            play-by-play table doesn't exist.
+        """
+        query, params = self._play_by_play_query(game_id, period)
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+        except duckdb.CatalogException:
+            cursor.close()
+            return None
+
+        def rows() -> Iterator[dict]:
+            cols = [desc[0] for desc in cursor.description]
+            try:
+                while batch := cursor.fetchmany(batch_size):
+                    for row in batch:
+                        yield dict(zip(cols, row, strict=False))
+            finally:
+                cursor.close()
+
+        return rows()
+
+    def _date_key(self, game_date) -> str:
+        if hasattr(game_date, "isoformat"):
+            return game_date.isoformat()
+        return str(game_date)
+
+    def _with_team_abbrevs(self, games: Iterable[dict]) -> list[dict]:
+        # Resolve abbreviations from the cached team table instead of joining
+        # dim_teams twice per query.
+        teams = reference.get_teams_by_id(self.conn)
+        rows = []
+        for game in games:
+            home = teams.get(game["home_team_id"])
+            away = teams.get(game["away_team_id"])
+            game["home_team_abbrev"] = home["abbreviation"] if home else None
+            game["away_team_abbrev"] = away["abbreviation"] if away else None
+            rows.append(game)
+        return rows
+
+    def _play_by_play_query(
+        self, game_id: int, period: int | None
+    ) -> tuple[str, list[int]]:
+        query = game_queries.GET_PLAY_BY_PLAY
+        params = [game_id]
+
+        if period is not None:
+            query += " AND period = ?"
+            params.append(period)
+
+        return query + game_queries.PLAY_BY_PLAY_ORDER, params
+
     def get_games_week(self, reference_date: date | None = None) -> dict:
         """Retrieve games for a week centered on the reference date.
 
@@ -237,16 +321,11 @@ class GameService:
             "items"
         ]
 
-        games_by_date = {}
-        for game in games:
-            d = (
-                game["game_date"].isoformat()
-                if hasattr(game["game_date"], "isoformat")
-                else str(game["game_date"])
-            )
-            if d not in games_by_date:
-                games_by_date[d] = []
-            games_by_date[d].append(game)
+        # list_games orders by date, so each day's games are already contiguous.
+        games_by_date = {
+            self._date_key(game_date): list(day_games)
+            for game_date, day_games in groupby(games, key=itemgetter("game_date"))
+        }
 
         return {
             "start_date": start_date.isoformat(),
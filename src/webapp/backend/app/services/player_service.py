@@ -5,9 +5,39 @@ data access operations including listing players, retrieving player details,
 game logs, career statistics, and splits.
 """
 
+import base64
+
 import duckdb
+import orjson
 
 from app.db.queries import players as player_queries
+from app.utils.sql import contains_pattern
+
+# Missing names sort as '' so the keyset comparison never meets a NULL, which
+# would make the row comparison NULL and silently drop those players.
+_SORT_KEY = "COALESCE(q.last_name, ''), COALESCE(q.first_name, ''), q.player_id"
+
+
+def _encode_cursor(player: dict) -> str:
+    """Encode a player's sort key as an opaque pagination cursor."""
+    key = [player["last_name"] or "", player["first_name"] or "", player["player_id"]]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def _decode_cursor(cursor: str) -> list:
+    """Decode a pagination cursor into its (last, first, id) sort key.
+
+    Raises:
+        ValueError: If the cursor was not produced by ``_encode_cursor``.
+    """
+    try:
+        last_name, first_name, player_id = orjson.loads(
+            base64.urlsafe_b64decode(cursor)
+        )
+    except (ValueError, TypeError) as e:
+        msg = "Invalid pagination cursor"
+        raise ValueError(msg) from e
+    return [last_name, first_name, player_id]
 
 
 class PlayerService:
@@ -38,11 +68,15 @@ class PlayerService:
         search: str | None = None,
         season_year: int | None = None,
         team_abbrev: str | None = None,
+        *,
+        cursor: str | None = None,
     ) -> dict:
         """Retrieve a paginated list of players with optional filters.
 
         Supports filtering by active status, position, search term, season year,
-        and team abbreviation. Results are ordered by last name, then first name.
+        and team abbreviation. Results are ordered by last name, first name and
+        player ID. Passing the previous response's ``next_cursor`` seeks
+        straight to the following page instead of skipping rows with OFFSET.
 
         Args:
             page: Page number for pagination (1-indexed). Defaults to 1.
@@ -52,14 +86,19 @@ class PlayerService:
             search: Case-insensitive search on first/last name (prefix match).
             season_year: Filter by current season year for the player.
             team_abbrev: Filter by team abbreviation (e.g., 'LAL', 'BOS').
+            cursor: Keyset cursor from a previous page. Overrides ``page``.
 
         Returns:
             dict: Paginated response containing:
                 - items: List of player records.
                 - total: Total count of matching players.
-                - page: Current page number.
+                - page: Current page number, or None when paging by cursor.
                 - per_page: Items per page.
                 - pages: Total number of pages.
+                - next_cursor: Cursor for the next page, or None on the last.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
         """
         query = player_queries.LIST_PLAYERS
         params = []
@@ -72,9 +111,14 @@ class PlayerService:
             query += " AND position = ?"
             params.append(position)
 
-        if search:
-            query += " AND (first_name ILIKE ? OR last_name ILIKE ?)"
-            pattern = f"%{search}%"
+        if search and " " in search.strip():
+            query += " AND (first_name || ' ' || last_name) ILIKE ? ESCAPE '\\'"
+            params.append(contains_pattern(search.strip()))
+        elif search:
+            query += (
+                " AND (first_name ILIKE ? ESCAPE '\\' OR last_name ILIKE ? ESCAPE '\\')"
+            )
+            pattern = contains_pattern(search)
             params.extend([pattern, pattern])
 
         if season_year:
@@ -85,23 +129,46 @@ class PlayerService:
             query += " AND team_abbrev = ?"
             params.append(team_abbrev.upper())
 
-        count_sql = f"SELECT COUNT(*) FROM ({query}) as q"
-        total = self.conn.execute(count_sql, params).fetchone()[0]
-
-        query += " ORDER BY last_name, first_name LIMIT ? OFFSET ?"
-        params.extend([per_page, (page - 1) * per_page])
-
-        result = self.conn.execute(query, params).fetchall()
-
-        columns = [desc[0] for desc in self.conn.description]
-        items = [dict(zip(columns, row, strict=False)) for row in result]
+        # The window count is computed before the cursor predicate and LIMIT,
+        # so the page and the total come back from a single scan. One extra
+        # row tells whether there is a next page.
+        page_sql = (
+            "SELECT * FROM ("
+            f"SELECT q.*, COUNT(*) OVER () AS total_count FROM ({query}) as q"
+            ") as q"
+        )
+        page_params = [*params]
+        if cursor:
+            page_sql += f" WHERE ({_SORT_KEY}) > (?, ?, ?)"
+            page_params.extend(_decode_cursor(cursor))
+        page_sql += f" ORDER BY {_SORT_KEY} LIMIT ?"
+        page_params.append(per_page + 1)
+        if not cursor:
+            page_sql += " OFFSET ?"
+            page_params.append((page - 1) * per_page)
+
+        result = self.conn.execute(page_sql, page_params).fetchall()
+        columns = [desc[0] for desc in self.conn.description][:-1]
+        items = [dict(zip(columns, row[:-1], strict=False)) for row in result]
+        next_cursor = None
+        if len(items) > per_page:
+            items = items[:per_page]
+            next_cursor = _encode_cursor(items[-1])
+
+        if result:
+            total = result[0][-1]
+        else:
+            # A page past the end has no rows to carry the window count.
+            count_sql = f"SELECT COUNT(*) FROM ({query}) as q"
+            total = self.conn.execute(count_sql, params).fetchone()[0]
 
         return {
             "items": items,
             "total": total,
-            "page": page,
+            "page": None if cursor else page,
             "per_page": per_page,
             "pages": (total + per_page - 1) // per_page,
+            "next_cursor": next_cursor,
         }
 
     def get_player_by_slug(self, slug: str) -> dict | None:
@@ -144,17 +211,24 @@ class PlayerService:
                 - totals: Aggregated totals (games_played, points, rebounds, assists).
             None if player not found.
         """
-        player = self.get_player_by_slug(player_slug)
-
-        if not player:
-            return None
-
         rows = self.conn.execute(
             player_queries.GET_PLAYER_GAME_LOG, [player_slug, season_year, season_type]
         ).fetchall()
-
         columns = [desc[0] for desc in self.conn.description]
+
+        if rows:
+            player_name = rows[0][columns.index("player_name")]
+        else:
+            # No games that season: look the player up to tell an empty log
+            # from an unknown player.
+            player = self.get_player_by_slug(player_slug)
+            if not player:
+                return None
+            player_name = player["full_name"]
+
         games = [dict(zip(columns, row, strict=False)) for row in rows]
+        for game in games:
+            del game["player_name"]
 
         totals = {
             "games_played": len(games),
@@ -165,7 +239,7 @@ class PlayerService:
 
         return {
             "player_slug": player_slug,
-            "player_name": player["full_name"],
+            "player_name": player_name,
             "season_year": season_year,
             "season_type": season_type,
             "games": games,
@@ -214,5 +288,36 @@ class PlayerService:
             "career_points": total_points,
         }
 
-    def get_player_splits(self, _player_slug: str, _season_year: int) -> dict:
-        return {}
+    def get_player_splits(
+        self,
+        player_slug: str,
+        season_year: int,
+        season_type: str = "REGULAR",
+    ) -> dict:
+        """Retrieve home/away and win/loss splits for a player's season.
+
+        Args:
+            player_slug: Player's unique slug identifier.
+            season_year: The season year (e.g., 2024 for 2023-24 season).
+            season_type: Type of season (REGULAR or PLAYOFF). Defaults to REGULAR.
+
+        Returns:
+            dict: Splits keyed by 'home', 'away', 'wins' and 'losses', each with
+                games played, totals and per-game averages. Empty if the player
+                has no games that season.
+        """
+        rows = self.conn.execute(
+            player_queries.GET_PLAYER_SPLITS, [player_slug, season_year, season_type]
+        ).fetchall()
+        if not rows:
+            return {}
+
+        columns = [desc[0] for desc in self.conn.description][1:]
+        splits = {row[0]: dict(zip(columns, row[1:], strict=False)) for row in rows}
+
+        return {
+            "player_slug": player_slug,
+            "season_year": season_year,
+            "season_type": season_type,
+            "splits": splits,
+        }
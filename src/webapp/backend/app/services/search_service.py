@@ -9,7 +9,8 @@ import duckdb
 import structlog
 
 from app.db.queries import search as search_queries
-from app.search.indexer import SearchIndexer
+from app.search.indexer import SearchIndexer, get_search_indexer
+from app.utils.sql import contains_pattern
 
 logger = structlog.get_logger(__name__)
 
@@ -42,10 +43,10 @@ class SearchService:
         """Lazy-load and return the SearchIndexer instance.
 
         Returns:
-            SearchIndexer: Configured search indexer instance.
+            SearchIndexer: The process-wide search indexer.
         """
         if self._indexer is None:
-            self._indexer = SearchIndexer()
+            self._indexer = get_search_indexer()
         return self._indexer
 
     def search(
@@ -64,7 +65,9 @@ class SearchService:
 
         if self.use_meilisearch:
             try:
-                meili_results = self.indexer.search_all(query, limit_per_index=limit)
+                meili_results = self.indexer.search_all(
+                    query, limit_per_index=limit, entity_type=entity_type
+                )
 
                 if entity_type is None or entity_type == "player":
                     results["players"] = [
@@ -118,47 +121,47 @@ class SearchService:
             else:
                 return {"query": query, "suggestions": suggestions}
 
-        suggestions = []
-
-        player_result = self.conn.execute(
-            search_queries.SEARCH_PLAYERS_DB, [f"%{query}%", f"%{query}%", limit // 2]
-        ).fetchall()
-        cols = [desc[0] for desc in self.conn.description]
-
-        for row in player_result:
-            p = dict(zip(cols, row, strict=False))
-            suggestions.append(
-                {
-                    "type": "player",
-                    "id": p.get("player_id"),
-                    "slug": p.get("slug"),
-                    "text": p.get("full_name"),
-                    "subtitle": p.get("position", "").replace("_", " ")
-                    if p.get("position")
-                    else "",
-                    "url": f"/players/{p.get('slug')}",
-                }
-            )
-
-        team_result = self.conn.execute(
-            search_queries.SEARCH_TEAMS_DB,
-            [f"%{query}%", f"%{query}%", f"%{query}%", limit // 2],
-        ).fetchall()
-        cols = [desc[0] for desc in self.conn.description]
-
-        for row in team_result:
-            t = dict(zip(cols, row, strict=False))
-            suggestions.append(
-                {
-                    "type": "team",
-                    "id": t.get("team_id"),
-                    "text": f"{t.get('city')} {t.get('name')}",
-                    "subtitle": t.get("abbreviation"),
-                    "url": f"/teams/{t.get('abbreviation')}",
-                }
-            )
+        if " " in query.strip():
+            sql = search_queries.AUTOCOMPLETE_BY_FULL_NAME_DB
+        else:
+            sql = search_queries.AUTOCOMPLETE_DB
+        pattern = contains_pattern(query)
+        params = [
+            *self._player_search_params(query),
+            limit // 2,
+            pattern,
+            pattern,
+            pattern,
+            limit // 2,
+        ]
+        rows = self.conn.execute(sql, params).fetchall()
+
+        players = []
+        teams = []
+        for kind, item_id, slug, text, subtitle in rows:
+            if kind == "player":
+                players.append(
+                    {
+                        "type": "player",
+                        "id": item_id,
+                        "slug": slug,
+                        "text": text,
+                        "subtitle": subtitle.replace("_", " ") if subtitle else "",
+                        "url": f"/players/{slug}",
+                    }
+                )
+            else:
+                teams.append(
+                    {
+                        "type": "team",
+                        "id": item_id,
+                        "text": text,
+                        "subtitle": subtitle,
+                        "url": f"/teams/{subtitle}",
+                    }
+                )
 
-        return {"query": query, "suggestions": suggestions}
+        return {"query": query, "suggestions": players + teams}
 
     def _db_search_players(
         self,
@@ -168,13 +171,23 @@ class SearchService:
         _active_only: bool = False,
         _team_abbrev: str | None = None,
     ) -> list[dict]:
-        sql = search_queries.SEARCH_PLAYERS_DB
-        params = [f"%{query}%", f"%{query}%", limit]
+        if " " in query.strip():
+            sql = search_queries.SEARCH_PLAYERS_BY_FULL_NAME_DB
+        else:
+            sql = search_queries.SEARCH_PLAYERS_DB
+        params = [*self._player_search_params(query), limit]
 
         result = self.conn.execute(sql, params).fetchall()
         cols = [desc[0] for desc in self.conn.description]
         return [dict(zip(cols, row, strict=False)) for row in result]
 
+    def _player_search_params(self, query: str) -> list[str]:
+        """Name patterns for the player search queries, minus the limit."""
+        if " " in query.strip():
+            return [contains_pattern(query.strip())]
+        pattern = contains_pattern(query)
+        return [pattern, pattern]
+
     def _db_search_teams(
         self,
         query: str,
@@ -182,7 +195,8 @@ class SearchService:
         _active_only: bool = True,
     ) -> list[dict]:
         sql = search_queries.SEARCH_TEAMS_DB
-        params = [f"%{query}%", f"%{query}%", f"%{query}%", limit]
+        pattern = contains_pattern(query)
+        params = [pattern, pattern, pattern, limit]
 
         result = self.conn.execute(sql, params).fetchall()
         cols = [desc[0] for desc in self.conn.description]
@@ -5,10 +5,29 @@ data access operations including listing seasons, retrieving season details,
 player statistics, and scheduling information.
 """
 
+from threading import Lock
+
 import duckdb
+from cachetools import TTLCache
 
+from app.db.connection import database_version
 from app.db.queries import seasons as season_queries
 
+# Season rows change once a year; keep them per process instead of querying
+# on every request that needs season context. Entries are keyed by the
+# database file version so an ETL build (including a season rollover) is
+# picked up on the next request.
+_season_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
+_current_year_cache: TTLCache = TTLCache(maxsize=1, ttl=600)
+_season_cache_lock = Lock()
+
+
+def clear_season_cache() -> None:
+    """Drop this process's cached season rows."""
+    with _season_cache_lock:
+        _season_cache.clear()
+        _current_year_cache.clear()
+
 
 class SeasonService:
     """Service for managing season data retrieval and aggregation.
@@ -31,12 +50,24 @@ class SeasonService:
         return [dict(zip(columns, row, strict=False)) for row in result]
 
     def get_current_season(self):
-        max_year = self.conn.execute("SELECT MAX(year) FROM season").fetchone()[0]
-        if not max_year:
-            return None
+        version = database_version()
+        with _season_cache_lock:
+            max_year = _current_year_cache.get(version)
+        if max_year is None:
+            max_year = self.conn.execute("SELECT MAX(year) FROM season").fetchone()[0]
+            if not max_year:
+                return None
+            with _season_cache_lock:
+                _current_year_cache[version] = max_year
         return self.get_season_by_year(max_year)
 
     def get_season_by_year(self, year: int):
+        key = (database_version(), year)
+        with _season_cache_lock:
+            cached = _season_cache.get(key)
+        if cached is not None:
+            return cached
+
         result = self.conn.execute(
             season_queries.GET_SEASON_BY_YEAR, [year, year, year]
         ).fetchone()
@@ -45,7 +76,10 @@ class SeasonService:
             return None
 
         columns = [desc[0] for desc in self.conn.description]
-        return dict(zip(columns, result, strict=False))
+        season = dict(zip(columns, result, strict=False))
+        with _season_cache_lock:
+            _season_cache[key] = season
+        return season
 
     def get_season_schedule(self, season_year: int, month: int | None = None):
         query = season_queries.GET_SEASON_SCHEDULE
@@ -82,16 +116,10 @@ class SeasonService:
 
         result = self.conn.execute(query, params).fetchall()
         columns = [desc[0] for desc in self.conn.description]
-        rows = [dict(zip(columns, row, strict=False)) for row in result]
-
-        players = {}
-        for row in rows:
-            pid = row["player_id"]
-            if pid not in players or row["is_combined_totals"]:
-                players[pid] = row
+        players = self._select_player_rows(columns, result)
 
         leaders = []
-        for p in players.values():
+        for p in players:
             val = p.get(stat_col, 0) or 0
             gp = p.get("games_played", 1) or 1
             if per_game:
@@ -145,15 +173,7 @@ class SeasonService:
 
         result = self.conn.execute(query, params).fetchall()
         columns = [desc[0] for desc in self.conn.description]
-        items = [dict(zip(columns, row, strict=False)) for row in result]
-
-        unique_items = {}
-        for item in items:
-            pid = item["player_id"]
-            if pid not in unique_items or item.get("is_combined_totals"):
-                unique_items[pid] = item
-
-        items = list(unique_items.values())
+        items = self._select_player_rows(columns, result)
 
         if not is_advanced and stat_type in {"per_game", "per_36", "per_100"}:
             items = [self._apply_rate_transform(stat_type, item) for item in items]
@@ -174,6 +194,20 @@ class SeasonService:
             "pages": (total + per_page - 1) // per_page,
         }
 
+    def _select_player_rows(
+        self, columns: list[str], result: list[tuple]
+    ) -> list[dict]:
+        # Traded players have one row per team plus a combined-totals row;
+        # keep the combined row when present, otherwise the first seen.
+        selected: dict = {}
+        for values in result:
+            row = dict(zip(columns, values, strict=False))
+            pid = row["player_id"]
+            selected[pid] = (
+                row if row.get("is_combined_totals") else selected.get(pid, row)
+            )
+        return list(selected.values())
+
     def _apply_rate_transform(self, stat_type: str, item: dict) -> dict:
         games_played = max(item.get("games_played", 0), 1)
         minutes_played = item.get("minutes_played", 0) or 0
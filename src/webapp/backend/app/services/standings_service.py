@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, select, union_all
 
 from app.models.game import Game
 from app.models.season import Conference, Division, Season
@@ -14,6 +14,28 @@ from app.models.team import Team, TeamSeason
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+# Statements are built once at import and bound per call, so each request
+# skips rebuilding the construct and goes straight to the compiled cache.
+_SEASON_ID_QUERY = select(Season.season_id).where(
+    Season.year == bindparam("season_year")
+)
+_STANDINGS_QUERY = (
+    select(TeamSeason, Team, Conference.conference_type)
+    .join(Team, TeamSeason.team_id == Team.team_id)
+    .join(Division, Team.division_id == Division.division_id)
+    .join(Conference, Division.conference_id == Conference.conference_id)
+    .where(TeamSeason.season_id == bindparam("season_id"))
+    .where(TeamSeason.season_type == "REGULAR")
+)
+_SEASON_TEAMS_QUERY = (
+    select(Team, Conference.conference_type)
+    .join(TeamSeason, TeamSeason.team_id == Team.team_id)
+    .join(Division, Team.division_id == Division.division_id)
+    .join(Conference, Division.conference_id == Conference.conference_id)
+    .where(TeamSeason.season_id == bindparam("season_id"))
+    .where(TeamSeason.season_type == "REGULAR")
+)
+
 
 class StandingsService:
     def __init__(self, session: Session):
@@ -24,25 +46,13 @@ class StandingsService:
         if season_id is None:
             return {"season_year": season_year, "view": view}
 
-        query = (
-            select(TeamSeason, Team, Conference.conference_type)
-            .join(Team, TeamSeason.team_id == Team.team_id)
-            .join(Division, Team.division_id == Division.division_id)
-            .join(Conference, Division.conference_id == Conference.conference_id)
-            .where(TeamSeason.season_id == season_id)
-            .where(TeamSeason.season_type == "REGULAR")
-        )
-        result = self.session.execute(query)
+        result = self.session.execute(_STANDINGS_QUERY, {"season_id": season_id})
         rows = result.all()
 
         standings = [self._row_to_team_dict(ts, team) for ts, team, _ in rows]
         conference_map = {}
         for (_ts, _team, conference_type), entry in zip(rows, standings, strict=True):
-            key = (
-                conference_type.value
-                if hasattr(conference_type, "value")
-                else conference_type
-            )
+            key = self._conference_key(conference_type)
             conference_map.setdefault(key, []).append(entry)
 
         if view == "league":
@@ -66,52 +76,17 @@ class StandingsService:
             return {"season_year": season_year, "view": view}
 
         cutoff = date.fromisoformat(as_of_date)
-        game_query = (
-            select(Game)
-            .where(Game.season_id == season_id)
-            .where(Game.season_type == "REGULAR")
-            .where(Game.game_date <= cutoff)
-            .where(Game.home_score.isnot(None))
-            .where(Game.away_score.isnot(None))
-        )
-        result = self.session.execute(game_query)
-        games = result.scalars().all()
-
-        records: dict[int, dict[str, int]] = {}
-        for game in games:
-            home_id = game.home_team_id
-            away_id = game.away_team_id
-            if home_id not in records:
-                records[home_id] = {"wins": 0, "losses": 0}
-            if away_id not in records:
-                records[away_id] = {"wins": 0, "losses": 0}
-
-            if game.home_score > game.away_score:
-                records[home_id]["wins"] += 1
-                records[away_id]["losses"] += 1
-            else:
-                records[away_id]["wins"] += 1
-                records[home_id]["losses"] += 1
-
-        team_query = (
-            select(Team, Conference.conference_type)
-            .join(TeamSeason, TeamSeason.team_id == Team.team_id)
-            .join(Division, Team.division_id == Division.division_id)
-            .join(Conference, Division.conference_id == Conference.conference_id)
-            .where(TeamSeason.season_id == season_id)
-            .where(TeamSeason.season_type == "REGULAR")
+        records = self._records_as_of(season_id, cutoff)
+
+        team_result = self.session.execute(
+            _SEASON_TEAMS_QUERY, {"season_id": season_id}
         )
-        team_result = self.session.execute(team_query)
         team_rows = team_result.all()
 
         standings = []
         conference_map: dict[str, list[dict]] = {}
         for team, conference_type in team_rows:
-            key = (
-                conference_type.value
-                if hasattr(conference_type, "value")
-                else conference_type
-            )
+            key = self._conference_key(conference_type)
             record = records.get(team.team_id, {"wins": 0, "losses": 0})
             entry = {
                 "team_id": team.team_id,
@@ -155,9 +130,39 @@ class StandingsService:
         }
 
     def _get_season_id(self, season_year: int) -> int | None:
-        query = select(Season.season_id).where(Season.year == season_year)
-        result = self.session.execute(query)
-        return result.scalar_one_or_none()
+        return self.session.scalar(_SEASON_ID_QUERY, {"season_year": season_year})
+
+    def _records_as_of(self, season_id: int, cutoff: date) -> dict[int, dict[str, int]]:
+        # Aggregate in the database: one row per team instead of every game.
+        finished = (
+            Game.season_id == season_id,
+            Game.season_type == "REGULAR",
+            Game.game_date <= cutoff,
+            Game.home_score.isnot(None),
+            Game.away_score.isnot(None),
+        )
+        home_won = Game.home_score > Game.away_score
+        sides = union_all(
+            select(
+                Game.home_team_id.label("team_id"),
+                case((home_won, 1), else_=0).label("won"),
+            ).where(*finished),
+            select(
+                Game.away_team_id.label("team_id"),
+                case((home_won, 0), else_=1).label("won"),
+            ).where(*finished),
+        ).subquery()
+        query = select(sides.c.team_id, func.sum(sides.c.won), func.count()).group_by(
+            sides.c.team_id
+        )
+        return {
+            team_id: {"wins": int(wins), "losses": int(games - wins)}
+            for team_id, wins, games in self.session.execute(query)
+        }
+
+    def _conference_key(self, conference_type) -> str:
+        # Rows may carry the ConferenceType enum or its raw string value.
+        return getattr(conference_type, "value", conference_type)
 
     def _row_to_team_dict(self, ts: TeamSeason, team: Team) -> dict:
         return {
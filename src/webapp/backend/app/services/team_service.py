@@ -5,10 +5,29 @@ data access operations including listing teams, retrieving team details,
 roster information, schedules, and season statistics.
 """
 
+from threading import Lock
+
 import duckdb
+from cachetools import TTLCache
 
+from app.db import reference
+from app.db.connection import database_version
 from app.db.queries import teams as team_queries
 
+# A franchise's season-by-season history only grows when a season ends.
+# Entries are keyed by the database file version, so the next request after
+# an ETL build reads the new history.
+# Standings and schedules use the Redis response cache instead, because
+# they are scoped to a season whose epoch ingestion bumps.
+_history_cache: TTLCache = TTLCache(maxsize=64, ttl=600)
+_history_cache_lock = Lock()
+
+
+def clear_team_history_cache() -> None:
+    """Drop this process's cached team histories."""
+    with _history_cache_lock:
+        _history_cache.clear()
+
 
 class TeamService:
     """Service for managing team data retrieval and aggregation.
@@ -30,23 +49,12 @@ class TeamService:
         conference: str | None = None,  # noqa: ARG002
         division: str | None = None,  # noqa: ARG002
     ) -> list[dict]:
-        query = team_queries.LIST_TEAMS
-        params = []
-
-        result = self.conn.execute(query, params).fetchall()
-        columns = [desc[0] for desc in self.conn.description]
-        return [dict(zip(columns, row, strict=False)) for row in result]
+        teams = reference.get_teams_by_id(self.conn).values()
+        return [dict(team) for team in teams]
 
     def get_team_by_abbreviation(self, abbreviation: str) -> dict | None:
-        result = self.conn.execute(
-            team_queries.GET_TEAM_BY_ABBREVIATION, [abbreviation.upper()]
-        ).fetchone()
-
-        if not result:
-            return None
-
-        columns = [desc[0] for desc in self.conn.description]
-        return dict(zip(columns, result, strict=False))
+        team = reference.get_team_by_abbreviation(self.conn, abbreviation.upper())
+        return dict(team) if team else None
 
     def get_team_roster(self, abbreviation: str, season_year: int) -> list[dict]:
         team = self.get_team_by_abbreviation(abbreviation)
@@ -67,7 +75,7 @@ class TeamService:
             return []
         team_id = team["team_id"]
 
-        params = [team_id] * 8 + [season_year]
+        params = [team_id] * 6 + [season_year]
 
         result = self.conn.execute(team_queries.GET_TEAM_SCHEDULE, params).fetchall()
 
@@ -94,15 +102,26 @@ class TeamService:
         return dict(zip(columns, result, strict=False))
 
     def get_team_history(self, abbreviation: str) -> list[dict]:
+        abbreviation = abbreviation.upper()
+        key = (database_version(), abbreviation)
+        with _history_cache_lock:
+            cached = _history_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             result = self.conn.execute(
-                team_queries.GET_TEAM_HISTORY, [abbreviation.upper()]
+                team_queries.GET_TEAM_HISTORY, [abbreviation]
             ).fetchall()
         except duckdb.CatalogException:
             return []
 
         columns = [desc[0] for desc in self.conn.description]
-        return [dict(zip(columns, row, strict=False)) for row in result]
+        history = [dict(zip(columns, row, strict=False)) for row in result]
+        if history:
+            with _history_cache_lock:
+                _history_cache[key] = history
+        return history
 
     def get_franchise_history(self, abbreviation: str) -> dict | None:
         try:
@@ -0,0 +1,23 @@
+"""Helpers for building SQL query parameters."""
+
+LIKE_ESCAPE = "\\"
+
+
+def contains_pattern(term: str) -> str:
+    """Build an ``ILIKE ... ESCAPE '\\'`` pattern matching ``term`` anywhere.
+
+    ``%`` and ``_`` in user input are escaped so they match literally
+    instead of acting as wildcards.
+
+    Args:
+        term: The raw search term.
+
+    Returns:
+        str: The pattern to bind against ``ILIKE ? ESCAPE '\\'``.
+    """
+    escaped = (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+    return f"%{escaped}%"
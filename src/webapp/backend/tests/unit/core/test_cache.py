@@ -0,0 +1,54 @@
+import pytest
+import redis
+from app.core import cache
+from starlette.requests import Request
+
+
+class _DownRedis:
+    calls = 0
+
+    def mget(self, _keys):
+        _DownRedis.calls += 1
+        raise redis.ConnectionError
+
+
+@pytest.fixture(autouse=True)
+def _down_redis(monkeypatch):
+    _DownRedis.calls = 0
+    monkeypatch.setattr(cache, "get_redis_client", _DownRedis)
+    monkeypatch.setattr(cache, "_redis_retry_at", 0.0)
+
+
+def _request(headers=None):
+    raw = [(k.encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_cached_response_falls_back_when_redis_is_down():
+    response = cache.cached_response(
+        _request(), "k", lambda: [1, 2], model=list[int], season_year=2024
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.body == b"[1,2]"
+    assert response.headers["etag"] == cache.make_etag(b"[1,2]")
+
+
+def test_cached_response_returns_304_on_matching_etag():
+    request = _request({"if-none-match": cache.make_etag(b"[1,2]")})
+
+    response = cache.cached_response(
+        request, "k", lambda: [1, 2], model=list[int], season_year=2024
+    )
+
+    assert response.status_code == 304  # noqa: PLR2004
+    assert response.body == b""
+
+
+def test_cached_response_skips_redis_after_a_failure():
+    for _ in range(3):
+        cache.cached_response(
+            _request(), "k", lambda: [1, 2], model=list[int], season_year=2024
+        )
+
+    assert _DownRedis.calls == 1
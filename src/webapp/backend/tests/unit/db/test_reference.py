@@ -0,0 +1,40 @@
+import duckdb
+from app.db import reference
+
+
+def test_team_lookups_are_served_from_cache():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_teams (team_id INTEGER, abbreviation VARCHAR, "
+        "name VARCHAR, city VARCHAR, arena VARCHAR)"
+    )
+    conn.execute("INSERT INTO dim_teams VALUES (1, 'BOS', 'Celtics', NULL, NULL)")
+    reference.clear_reference_cache()
+
+    assert reference.get_teams_by_id(conn)[1]["abbreviation"] == "BOS"
+
+    conn.execute("DELETE FROM dim_teams")
+    assert reference.get_team_by_abbreviation(conn, "BOS")["team_id"] == 1
+    assert reference.get_team_by_abbreviation(conn, "LAL") is None
+
+    reference.clear_reference_cache()
+    assert reference.get_teams_by_id(conn) == {}
+
+
+def test_team_cache_reloads_when_the_database_changes(monkeypatch):
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_teams (team_id INTEGER, abbreviation VARCHAR, "
+        "name VARCHAR, city VARCHAR, arena VARCHAR)"
+    )
+    conn.execute("INSERT INTO dim_teams VALUES (1, 'BOS', 'Celtics', NULL, NULL)")
+    monkeypatch.setattr(reference, "database_version", lambda: 1)
+    reference.clear_reference_cache()
+    assert reference.get_team_by_abbreviation(conn, "NOP") is None
+
+    conn.execute("INSERT INTO dim_teams VALUES (2, 'NOP', 'Pelicans', NULL, NULL)")
+    monkeypatch.setattr(reference, "database_version", lambda: 2)
+
+    assert reference.get_team_by_abbreviation(conn, "NOP")["team_id"] == 2  # noqa: PLR2004
+    assert set(reference.get_teams_by_id(conn)) == {1, 2}
+    reference.clear_reference_cache()
@@ -0,0 +1,134 @@
+import duckdb
+import httpx
+import orjson
+from app.search.client import INDEX_CONFIGS, INDEX_SETTINGS
+from app.search.indexer import GAME_DOCUMENT_FIELDS, SearchIndexer, clear_search_cache
+
+
+def _recording_http_client(batches):
+    def handler(request):
+        assert request.headers["content-type"] == "application/x-ndjson"
+        documents = [orjson.loads(line) for line in request.content.splitlines()]
+        batches.append((request.url.path, documents))
+        return httpx.Response(202, json={"taskUid": len(batches)})
+
+    return httpx.Client(
+        base_url="http://meili.test", transport=httpx.MockTransport(handler)
+    )
+
+
+def test_index_in_batches_builds_documents_from_rows():
+    batches = []
+    indexer = SearchIndexer(
+        client=object(),  # type: ignore[arg-type]
+        http_client=_recording_http_client(batches),
+    )
+    conn = duckdb.connect()
+    cursor = conn.execute(
+        "SELECT * FROM (VALUES (1, 100, 'REGULAR'), (2, NULL, 'PLAYOFF')) "
+        "AS g(game_id, home_score, season_type)"
+    )
+
+    count = indexer._index_in_batches(
+        cursor,
+        "games",
+        "game_id",
+        GAME_DOCUMENT_FIELDS,
+        batch_size=1,
+        finish=indexer._finish_game_document,
+    )
+
+    assert count == 2  # noqa: PLR2004
+    batches.sort(key=lambda batch: batch[1][0]["game_id"])
+    assert [path for path, _ in batches] == ["/indexes/games/documents"] * 2
+    first = batches[0][1][0]
+    assert first["away_score"] is None
+    assert first["is_final"] is True
+    assert first["matchup"] == "Game 1"
+    assert batches[1][1][0]["is_final"] is False
+
+
+def test_build_filter_expression_renders_each_type():
+    indexer = SearchIndexer(client=object(), http_client=object())  # type: ignore[arg-type]
+
+    expression = indexer._build_filter_expression(
+        {
+            "is_active": True,
+            "draft_year": 2003,
+            "position": "CENTER",
+            "debut_year": None,
+            "slug": ["jamesle01", 7],
+        }
+    )
+
+    assert expression == (
+        'is_active = true AND draft_year = 2003 AND position = "CENTER" '
+        'AND slug IN ["jamesle01", 7]'
+    )
+
+
+class _FakeIndex:
+    def __init__(self, settings):
+        self.settings = settings
+        self.updates = []
+
+    def get_settings(self):
+        return self.settings
+
+    def update_settings(self, settings):
+        self.updates.append(settings)
+
+
+class _FakeClient:
+    def __init__(self, index):
+        self._index = index
+
+    def create_index(self, uid, options):
+        pass
+
+    def index(self, _uid):
+        return self._index
+
+
+def test_setup_index_skips_unchanged_settings():
+    live = {"rankingRules": ["words"], **INDEX_SETTINGS["teams"]}
+    index = _FakeIndex(live)
+    indexer = SearchIndexer(client=_FakeClient(index), http_client=object())  # type: ignore[arg-type]
+
+    indexer._setup_index("teams", INDEX_CONFIGS["teams"])
+    assert index.updates == []
+
+    index.settings = {**live, "sortableAttributes": []}
+    indexer._setup_index("teams", INDEX_CONFIGS["teams"])
+    assert index.updates == [INDEX_SETTINGS["teams"]]
+
+
+def test_search_all_only_queries_requested_index():
+    requests = []
+
+    def handler(request):
+        body = orjson.loads(request.content)
+        requests.append(body)
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"indexUid": q["indexUid"], "hits": [{"team_id": 1}]}
+                    for q in body["queries"]
+                ]
+            },
+        )
+
+    clear_search_cache()
+    indexer = SearchIndexer(
+        client=object(),  # type: ignore[arg-type]
+        http_client=httpx.Client(
+            base_url="http://meili.test", transport=httpx.MockTransport(handler)
+        ),
+    )
+
+    results = indexer.search_all("celtics", entity_type="team")
+
+    assert [q["indexUid"] for q in requests[0]["queries"]] == ["teams"]
+    assert results == {"players": [], "teams": [{"team_id": 1}], "games": []}
+    clear_search_cache()
@@ -0,0 +1,64 @@
+import duckdb
+import pytest
+from app.db.reference import clear_reference_cache
+from app.services.game_service import GameService
+
+
+@pytest.fixture
+def service():
+    clear_reference_cache()
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_teams AS SELECT * FROM (VALUES "
+        "(1, 'BOS', 'Celtics', 'Boston', NULL), (2, 'NYK', 'Knicks', 'New York', NULL)) "
+        "AS t(team_id, abbreviation, name, city, arena)"
+    )
+    conn.execute(
+        "CREATE TABLE games AS SELECT * FROM (VALUES "
+        "(10, DATE '2024-01-01', 1, 2, 110, 100, 'REGULAR', 'TD Garden', 19156), "
+        "(11, DATE '2024-01-02', 2, 1, NULL, NULL, 'REGULAR', NULL, NULL)) "
+        "AS g(game_id, date, home_team_id, away_team_id, home_score, away_score, "
+        "season_type, arena, attendance)"
+    )
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT * FROM (VALUES "
+        "(1, 'tatumja01', 'Jayson', 'Tatum', 'SF'), "
+        "(2, 'brownja02', 'Jaylen', 'Brown', 'SG'), "
+        "(3, 'brunsja01', 'Jalen', 'Brunson', 'PG')) "
+        "AS p(player_id, slug, first_name, last_name, position)"
+    )
+    conn.execute(
+        "CREATE TABLE fact_player_gamelogs AS SELECT * FROM (VALUES "
+        "(10, 1, 1, 36.0, 30), (10, 2, 1, 38.0, 25), (10, 3, 2, 40.0, 35)) "
+        "AS pg(game_id, player_id, team_id, minutes_played, points)"
+    )
+    yield GameService(conn)
+    clear_reference_cache()
+
+
+def test_get_box_score_splits_players_by_team(service):
+    box_score = service.get_box_score(10)
+
+    assert box_score["game"]["game_id"] == 10  # noqa: PLR2004
+    assert box_score["home_team"]["team_abbrev"] == "BOS"
+    assert box_score["home_team"]["score"] == 110  # noqa: PLR2004
+    assert [p["slug"] for p in box_score["home_team"]["players"]] == [
+        "brownja02",
+        "tatumja01",
+    ]
+    assert box_score["away_team"]["team_abbrev"] == "NYK"
+    assert [p["full_name"] for p in box_score["away_team"]["players"]] == [
+        "Jalen Brunson"
+    ]
+
+
+def test_get_box_score_without_player_lines(service):
+    box_score = service.get_box_score(11)
+
+    assert box_score["game"]["home_team_abbrev"] == "NYK"
+    assert box_score["home_team"]["players"] == []
+    assert box_score["away_team"]["players"] == []
+
+
+def test_get_box_score_unknown_game(service):
+    assert service.get_box_score(99) is None
@@ -0,0 +1,139 @@
+import duckdb
+import pytest
+from app.services.player_service import PlayerService
+
+
+def test_list_players_pages_by_offset_and_cursor():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT * FROM (VALUES "
+        "(1, 'Jaylen', 'Brown', 'SG'), (2, 'Jayson', 'Tatum', 'SF'), "
+        "(3, 'Jrue', 'Holiday', 'PG'), (4, 'Derrick', 'White', 'PG')) "
+        "AS p(player_id, first_name, last_name, position)"
+    )
+    conn.execute(
+        "CREATE TABLE fact_player_gamelogs "
+        "(player_id INTEGER, team_id INTEGER, season_id INTEGER)"
+    )
+    conn.execute("CREATE TABLE dim_teams (team_id INTEGER, abbreviation VARCHAR)")
+    service = PlayerService(conn)
+
+    first_page = service.list_players(page=1, per_page=1, search="j")
+    past_end = service.list_players(page=5, per_page=1, search="j")
+
+    assert [p["last_name"] for p in first_page["items"]] == ["Brown"]
+    assert "total_count" not in first_page["items"][0]
+    assert first_page["total"] == 3  # noqa: PLR2004
+    assert first_page["pages"] == 3  # noqa: PLR2004
+    assert past_end["items"] == []
+    assert past_end["total"] == 3  # noqa: PLR2004
+    assert past_end["next_cursor"] is None
+
+    second_page = service.list_players(
+        per_page=1, search="j", cursor=first_page["next_cursor"]
+    )
+    third_page = service.list_players(
+        per_page=1, search="j", cursor=second_page["next_cursor"]
+    )
+
+    assert [p["last_name"] for p in second_page["items"]] == ["Holiday"]
+    assert second_page["total"] == 3  # noqa: PLR2004
+    assert [p["last_name"] for p in third_page["items"]] == ["Tatum"]
+    assert third_page["next_cursor"] is None
+
+
+def test_list_players_cursor_keeps_players_without_names():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT * FROM (VALUES "
+        "(1, NULL, 'Nene', 'C'), (2, NULL, 'Nene', 'PF'), (3, 'Al', 'Horford', 'C')) "
+        "AS p(player_id, first_name, last_name, position)"
+    )
+    conn.execute(
+        "CREATE TABLE fact_player_gamelogs "
+        "(player_id INTEGER, team_id INTEGER, season_id INTEGER)"
+    )
+    conn.execute("CREATE TABLE dim_teams (team_id INTEGER, abbreviation VARCHAR)")
+    service = PlayerService(conn)
+
+    seen = []
+    page = service.list_players(per_page=1)
+    while True:
+        seen.extend(p["player_id"] for p in page["items"])
+        if page["next_cursor"] is None:
+            break
+        page = service.list_players(per_page=1, cursor=page["next_cursor"])
+        assert page["page"] is None
+
+    assert seen == [3, 1, 2]
+
+
+def test_get_player_splits_aggregates_in_sql():
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE dim_players AS SELECT 1 player_id, 'tatumja01' slug")
+    conn.execute(
+        "CREATE TABLE dim_games AS SELECT * FROM (VALUES "
+        "(10, 1, 2, 110, 100), (11, 3, 1, 90, 120), (12, 1, 4, 95, 99)) "
+        "AS g(game_id, home_team_id, away_team_id, home_score, away_score)"
+    )
+    conn.execute(
+        "CREATE TABLE fact_player_gamelogs AS SELECT * FROM (VALUES "
+        "(1, 1, 10, 2024, 'REGULAR', 30, 10, 5), "
+        "(1, 1, 11, 2024, 'REGULAR', 20, 8, 4), "
+        "(1, 1, 12, 2024, 'REGULAR', 25, 6, 3)) "
+        "AS pg(player_id, team_id, game_id, season_year, season_type, "
+        "points_scored, rebounds_total, assists)"
+    )
+    service = PlayerService(conn)
+
+    result = service.get_player_splits("tatumja01", 2024)
+
+    splits = result["splits"]
+    assert splits["home"]["games_played"] == 2  # noqa: PLR2004
+    assert splits["home"]["points"] == 55  # noqa: PLR2004
+    assert splits["away"]["ppg"] == 20.0  # noqa: PLR2004
+    assert splits["wins"]["games_played"] == 2  # noqa: PLR2004
+    assert splits["losses"]["apg"] == 3.0  # noqa: PLR2004
+    assert service.get_player_splits("tatumja01", 2023) == {}
+
+
+def test_list_players_rejects_malformed_cursor():
+    service = PlayerService(conn=None)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="cursor"):
+        service.list_players(cursor="not-a-cursor")
+
+
+def test_get_player_game_log_reads_name_from_game_rows():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT * FROM (VALUES "
+        "(1, 'tatumja01', 'Jayson', 'Tatum')) "
+        "AS p(player_id, slug, first_name, last_name)"
+    )
+    conn.execute(
+        "CREATE TABLE dim_teams AS SELECT * FROM (VALUES (1, 'BOS'), (2, 'NYK')) "
+        "AS t(team_id, abbreviation)"
+    )
+    conn.execute(
+        "CREATE TABLE dim_games AS SELECT * FROM (VALUES "
+        "(10, DATE '2024-01-01', 1, 2, 110, 100)) "
+        "AS g(game_id, date, home_team_id, away_team_id, home_score, away_score)"
+    )
+    conn.execute(
+        "CREATE TABLE fact_player_gamelogs AS SELECT * FROM (VALUES "
+        "(1, 1, 10, 2024, 'REGULAR', 30, 10, 5)) "
+        "AS pg(player_id, team_id, game_id, season_year, season_type, "
+        "points_scored, rebounds_total, assists)"
+    )
+    service = PlayerService(conn)
+
+    result = service.get_player_game_log("tatumja01", 2024)
+    empty = service.get_player_game_log("tatumja01", 2023)
+
+    assert result["player_name"] == "Jayson Tatum"
+    assert "player_name" not in result["games"][0]
+    assert result["games"][0]["outcome"] == "WIN"
+    assert result["totals"]["points"] == 30  # noqa: PLR2004
+    assert empty["games"] == []
+    assert service.get_player_game_log("nobody01", 2024) is None
@@ -1,3 +1,4 @@
+import duckdb
 from app.services.search_service import SearchService
 
 
@@ -25,3 +26,57 @@ def test_normalize_game_hit():
     assert normalized["game_date"] == "2024-01-01"
     assert normalized["matchup"] == "BOS @ LAL"
     assert normalized["score"] == "100-110"
+
+
+def test_db_search_players_matches_full_name():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT *, NULL AS position, TRUE AS is_active, "
+        "NULL AS debut_year, NULL AS final_year FROM (VALUES "
+        "(1, 'jamesle01', 'LeBron', 'James'), (2, 'hardeja01', 'James', 'Harden')) "
+        "AS p(player_id, slug, first_name, last_name)"
+    )
+    service = SearchService(conn=conn, use_meilisearch=False)
+
+    full_name = service._db_search_players("lebron james", 10)
+    single_word = service._db_search_players("james", 10)
+
+    assert [p["player_id"] for p in full_name] == [1]
+    assert sorted(p["player_id"] for p in single_word) == [1, 2]
+
+
+def test_autocomplete_fallback_returns_players_then_teams():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT 1 AS player_id, 'bostonbo01' AS slug, "
+        "'Bob' AS first_name, 'Boston' AS last_name, 'SMALL_FORWARD' AS position, "
+        "TRUE AS is_active, NULL AS debut_year, NULL AS final_year"
+    )
+    conn.execute(
+        "CREATE TABLE dim_teams AS SELECT 2 AS team_id, 'BOS' AS abbreviation, "
+        "'Celtics' AS name, 'Boston' AS city, TRUE AS is_active"
+    )
+    service = SearchService(conn=conn, use_meilisearch=False)
+
+    result = service.autocomplete("boston")
+
+    assert [s["type"] for s in result["suggestions"]] == ["player", "team"]
+    player, team = result["suggestions"]
+    assert player["subtitle"] == "SMALL FORWARD"
+    assert player["url"] == "/players/bostonbo01"
+    assert team["text"] == "Boston Celtics"
+    assert team["url"] == "/teams/BOS"
+
+
+def test_db_search_players_treats_wildcards_literally():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_players AS SELECT *, NULL AS position, TRUE AS is_active, "
+        "NULL AS debut_year, NULL AS final_year FROM (VALUES "
+        "(1, 'jamesle01', 'LeBron', 'James')) "
+        "AS p(player_id, slug, first_name, last_name)"
+    )
+    service = SearchService(conn=conn, use_meilisearch=False)
+
+    assert service._db_search_players("%", 10) == []
+    assert service._db_search_players("_", 10) == []
@@ -0,0 +1,59 @@
+from app.services import season_service
+from app.services.season_service import SeasonService, clear_season_cache
+
+
+def test_select_player_rows_prefers_combined_totals():
+    service = SeasonService(conn=None)  # type: ignore[arg-type]
+    columns = ["player_id", "team_abbrev", "is_combined_totals"]
+    result = [
+        (1, "BOS", False),
+        (1, "TOT", True),
+        (1, "NYK", False),
+        (2, "LAL", False),
+        (2, "PHX", False),
+    ]
+
+    rows = service._select_player_rows(columns, result)
+
+    assert [row["team_abbrev"] for row in rows] == ["TOT", "LAL"]
+
+
+class _CountingConnection:
+    description = (("season_id",), ("year",))
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, _query, _params=None):
+        self.calls += 1
+        return self
+
+    def fetchone(self):
+        return (2024, 2024)
+
+
+def test_get_season_by_year_is_cached():
+    clear_season_cache()
+    conn = _CountingConnection()
+    service = SeasonService(conn=conn)  # type: ignore[arg-type]
+
+    first = service.get_season_by_year(2024)
+    second = service.get_season_by_year(2024)
+
+    assert first == second == {"season_id": 2024, "year": 2024}
+    assert conn.calls == 1
+    clear_season_cache()
+
+
+def test_season_cache_misses_after_the_database_changes(monkeypatch):
+    clear_season_cache()
+    conn = _CountingConnection()
+    service = SeasonService(conn=conn)  # type: ignore[arg-type]
+    monkeypatch.setattr(season_service, "database_version", lambda: 1)
+    service.get_season_by_year(2024)
+
+    monkeypatch.setattr(season_service, "database_version", lambda: 2)
+    service.get_season_by_year(2024)
+
+    assert conn.calls == 2  # noqa: PLR2004
+    clear_season_cache()
@@ -1,3 +1,4 @@
+from app.models.season import ConferenceType
 from app.services.standings_service import StandingsService
 
 
@@ -16,3 +17,10 @@ def test_apply_rank_and_games_back():
     assert ranked[1]["conference_rank"] == 2  # noqa: PLR2004
     assert ranked[1]["games_back"] == 2.0  # noqa: PLR2004
     assert ranked[2]["conference_rank"] == 3  # noqa: PLR2004
+
+
+def test_conference_key_accepts_enum_or_string():
+    service = StandingsService(session=None)  # type: ignore[arg-type]
+
+    assert service._conference_key(ConferenceType.EASTERN) == "EASTERN"
+    assert service._conference_key("WESTERN") == "WESTERN"
@@ -0,0 +1,71 @@
+import duckdb
+from app.db.reference import clear_reference_cache
+from app.services import team_service
+from app.services.team_service import TeamService, clear_team_history_cache
+
+
+def test_get_team_history_is_cached():
+    clear_team_history_cache()
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE team_seasons AS SELECT 2024 AS season_id, "
+        "'BOS' AS abbreviation, 64 AS wins, 18 AS losses, "
+        "0.780 AS win_percentage, TRUE AS made_playoffs"
+    )
+    service = TeamService(conn)
+
+    first = service.get_team_history("bos")
+    conn.execute("DELETE FROM team_seasons")
+    second = service.get_team_history("BOS")
+
+    assert [season["year"] for season in first] == [2024]
+    assert second == first
+    clear_team_history_cache()
+
+
+def test_team_history_cache_misses_after_the_database_changes(monkeypatch):
+    clear_team_history_cache()
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE team_seasons AS SELECT 2024 AS season_id, "
+        "'BOS' AS abbreviation, 64 AS wins, 18 AS losses, "
+        "0.780 AS win_percentage, TRUE AS made_playoffs"
+    )
+    service = TeamService(conn)
+    monkeypatch.setattr(team_service, "database_version", lambda: 1)
+    service.get_team_history("BOS")
+
+    conn.execute("INSERT INTO team_seasons VALUES (2025, 'BOS', 61, 21, 0.744, TRUE)")
+    monkeypatch.setattr(team_service, "database_version", lambda: 2)
+
+    history = service.get_team_history("BOS")
+
+    assert sorted(season["year"] for season in history) == [2024, 2025]
+    clear_team_history_cache()
+
+
+def test_get_team_schedule_results_match_final_scores():
+    clear_reference_cache()
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE dim_teams AS SELECT * FROM (VALUES "
+        "(1, 'BOS', 'Celtics', 'Boston', NULL), (2, 'NYK', 'Knicks', 'New York', NULL)) "
+        "AS t(team_id, abbreviation, name, city, arena)"
+    )
+    conn.execute(
+        "CREATE TABLE games AS SELECT * FROM (VALUES "
+        "(10, DATE '2024-01-01', 1, 2, 110, 100), "
+        "(11, DATE '2024-01-02', 2, 1, 99, 101), "
+        "(12, DATE '2024-01-03', 2, 1, 0, 0), "
+        "(13, DATE '2024-01-04', 1, 2, NULL, NULL)) "
+        "AS g(game_id, date, home_team_id, away_team_id, home_score, away_score)"
+    )
+    conn.execute("ALTER TABLE games ADD COLUMN season_year INTEGER DEFAULT 2024")
+    service = TeamService(conn)
+
+    boston = service.get_team_schedule("BOS", 2024)
+    new_york = service.get_team_schedule("NYK", 2024)
+
+    assert [game["result"] for game in boston] == ["W", "W", "L", "L"]
+    assert [game["result"] for game in new_york] == ["L", "L", "L", "L"]
+    clear_reference_cache()
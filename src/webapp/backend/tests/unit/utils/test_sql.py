@@ -0,0 +1,7 @@
+from app.utils.sql import contains_pattern
+
+
+def test_contains_pattern_escapes_wildcards():
+    assert contains_pattern("o'neal") == "%o'neal%"
+    assert contains_pattern("50%_") == "%50\\%\\_%"
+    assert contains_pattern("a\\b") == "%a\\\\b%"